@@ -1,13 +1,5 @@
-import sys
-import os
-
 def before_all(context):
     """Setup before all scenarios"""
-    # Add base directory to Python path
-    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'base')
-    if base_dir not in sys.path:
-        sys.path.append(base_dir)
-    
     # Set up context attributes
     context.test_results = []
     context.failed_scenarios = []
@@ -1,13 +1,7 @@
-import sys
-import os
 from typing import Dict, Any, List, Optional
 
-# Add the base directory to Python path
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
-
-from api.base_api_page import BaseAPIPage
-from api.api_client import BaseAPIClient
+from base.api.base_api_page import BaseAPIPage
+from base.api.base_api_client import BaseAPIClient
 
 
 class ProductsAPIPage(BaseAPIPage):
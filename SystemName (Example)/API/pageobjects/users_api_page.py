@@ -5,17 +5,11 @@ This module contains the UsersAPIPage class which provides methods to interact
 with user-related API endpoints following the Page Object Model pattern.
 """
 
-import sys
-import os
 from typing import Dict, Any, List, Optional
 import re
 
-# Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
-
-from api.base_api_page import BaseAPIPage
-from api.api_client import BaseAPIClient
+from base.api.base_api_page import BaseAPIPage
+from base.api.base_api_client import BaseAPIClient
 
 
 class UsersAPIPage(BaseAPIPage):
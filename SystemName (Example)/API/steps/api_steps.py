@@ -1,13 +1,7 @@
 from behave import given, when, then
-import sys
-import os
 import json
 
-# Add the base directory to Python path
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
-
-from api.api_client import BaseAPIClient
+from base.api.base_api_client import BaseAPIClient
 from ..pageobjects.users_api_page import UsersAPIPage
 
 
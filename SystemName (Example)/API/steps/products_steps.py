@@ -1,12 +1,6 @@
 from behave import given, when, then
-import sys
-import os
 
-# Add the base directory to Python path
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
-
-from api.api_client import BaseAPIClient
+from base.api.base_api_client import BaseAPIClient
 from ..pageobjects.products_api_page import ProductsAPIPage
 
 
@@ -1,10 +1,11 @@
 import sys
 import os
+from pathlib import Path
 
 def before_all(context):
     """Setup before all scenarios"""
     # Add base directory to Python path
-    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'base')
+    base_dir = str(Path(__file__).resolve().parents[3] / 'base')
     if base_dir not in sys.path:
         sys.path.append(base_dir)
     
@@ -1,11 +1,13 @@
 from behave import given, when, then
 import sys
 import os
+from pathlib import Path
 import time
 
 # Add the base directory to Python path
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from desktop.base_desktop_page import BaseDesktopPage
 from desktop.desktop_app_manager import DesktopAppManager
@@ -1,13 +1,19 @@
 import sys
 import os
+from pathlib import Path
 
 def before_all(context):
     """Setup before all scenarios"""
     # Add base directory to Python path
-    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'base')
+    base_dir = str(Path(__file__).resolve().parents[3] / 'base')
     if base_dir not in sys.path:
         sys.path.append(base_dir)
     
+    # Add the Mobile directory so page objects import as `pageobjects.*`
+    mobile_dir = str(Path(__file__).resolve().parents[1])
+    if mobile_dir not in sys.path:
+        sys.path.append(mobile_dir)
+    
     # Set up context attributes
     context.test_results = []
     context.failed_scenarios = []
@@ -28,6 +34,13 @@ def before_scenario(context, scenario):
         context.mobile_driver_manager = MobileDriverManager('config/mobile_config.ini')
         context.driver = context.mobile_driver_manager.start_driver(platform)
         
+        # Page objects are created once per scenario, as soon as the driver exists
+        from pageobjects.mobile_login_page import MobileLoginPage
+        from pageobjects.mobile_home_page import MobileHomePage
+        
+        context.mobile_login_page = MobileLoginPage(context.driver)
+        context.mobile_home_page = MobileHomePage(context.driver)
+        
         print(f"\n📱 Starting Mobile Scenario: {scenario.name}")
         print(f"Platform: {platform.upper()}")
 
@@ -1,9 +1,11 @@
 import sys
 import os
+from pathlib import Path
 
 # Add the base directory to Python path
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from appium.webdriver.common.appiumby import AppiumBy
 from mobile.base_mobile_page import BaseMobilePage
@@ -7,11 +7,13 @@ with mobile login functionality following the Page Object Model pattern.
 
 import sys
 import os
+from pathlib import Path
 from typing import Optional
 
 # Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.support import expected_conditions as EC
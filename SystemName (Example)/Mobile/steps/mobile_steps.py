@@ -1,10 +1,12 @@
 from behave import given, when, then
 import sys
 import os
+from pathlib import Path
 
 # Add the base directory to Python path
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from mobile.base_mobile_page import BaseMobilePage
 from mobile.mobile_driver_manager import MobileDriverManager
@@ -13,10 +15,6 @@ from mobile.mobile_driver_manager import MobileDriverManager
 @given('I have the mobile app installed and running')
 def step_mobile_app_running(context):
     """Ensure mobile app is installed and running"""
-    if not hasattr(context, 'mobile_login_page'):
-        from CentralQualityHub.Mobile.pageobjects.mobile_login_page import MobileLoginPage
-        context.mobile_login_page = MobileLoginPage(context.driver)
-    
     # Verify app is running
     assert context.mobile_login_page.is_app_launched(), "Mobile app is not running"
 
@@ -37,20 +35,12 @@ def step_tap_login_button(context):
 @then('I should be logged into the mobile app')
 def step_verify_mobile_login_success(context):
     """Verify successful login to mobile app"""
-    if not hasattr(context, 'mobile_home_page'):
-        from CentralQualityHub.Mobile.pageobjects.mobile_home_page import MobileHomePage
-        context.mobile_home_page = MobileHomePage(context.driver)
-    
     assert context.mobile_home_page.is_logged_in(), "User is not logged into mobile app"
 
 
 @then('I should see the mobile home screen')
 def step_verify_mobile_home_screen(context):
     """Verify mobile home screen is displayed"""
-    if not hasattr(context, 'mobile_home_page'):
-        from CentralQualityHub.Mobile.pageobjects.mobile_home_page import MobileHomePage
-        context.mobile_home_page = MobileHomePage(context.driver)
-    
     assert context.mobile_home_page.is_home_screen_displayed(), "Mobile home screen is not displayed"
 
 
@@ -99,8 +89,4 @@ def step_rotate_to_landscape(context):
 @then('the mobile home screen should be displayed in landscape mode')
 def step_verify_landscape_home_screen(context):
     """Verify home screen is displayed in landscape mode"""
-    if not hasattr(context, 'mobile_home_page'):
-        from CentralQualityHub.Mobile.pageobjects.mobile_home_page import MobileHomePage
-        context.mobile_home_page = MobileHomePage(context.driver)
-    
     assert context.mobile_home_page.is_in_landscape_mode(), "Home screen not in landscape mode"
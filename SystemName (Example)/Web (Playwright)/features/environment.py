@@ -1,17 +1,77 @@
 import sys
 import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple, Tuple
+
+# Per-step progress goes through this logger; it stays silent unless
+# BEHAVE_VERBOSE is set, so large suites don't pay for a print per step.
+step_logger = logging.getLogger("behave.steps")
+
+# Tags that require a Playwright browser for the scenario
+WEB_TAGS = frozenset({'web', 'playwright', 'login', 'user_management'})
+
+# Instrumentation is off by default to keep per-scenario overhead low.
+# PLAYWRIGHT_RECORD=1 records videos, PLAYWRIGHT_TRACE=1 keeps traces of
+# failed scenarios and PLAYWRIGHT_SLOW_MO slows actions down for debugging.
+RECORD_VIDEO = os.environ.get("PLAYWRIGHT_RECORD") == "1"
+TRACE_SCENARIOS = os.environ.get("PLAYWRIGHT_TRACE") == "1"
+SLOW_MO = int(os.environ.get("PLAYWRIGHT_SLOW_MO", "0"))
+
+# Identifies this process when scenarios are sharded across behavex workers.
+# Every worker launches its own browser, so only on-disk artifacts need scoping.
+WORKER_ID = os.environ.get("BEHAVEX_WORKER_ID", str(os.getpid()))
+
+
+class ScenarioResult(NamedTuple):
+    """Outcome of a single scenario, recorded for the run summary"""
+    scenario: str
+    status: str
+    tags: Tuple[str, ...]
+
 
 def before_all(context):
     """Setup before all scenarios"""
     # Add base directory to Python path
-    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
+    base_dir = str(Path(__file__).resolve().parents[3] / 'base')
     if base_dir not in sys.path:
         sys.path.append(base_dir)
     
+    # Add the Playwright suite directory so page objects import as `pageobjects.*`
+    suite_dir = str(Path(__file__).resolve().parents[1])
+    if suite_dir not in sys.path:
+        sys.path.append(suite_dir)
+    
+    # Explicit waits (wait_for_element / wait_for_page_load) give up after
+    # BEHAVE_PW_TIMEOUT ms, 5000 by default; raise it for slow environments
+    
+    # Enable per-step logging only when explicitly requested
+    if os.environ.get("BEHAVE_VERBOSE"):
+        logging.basicConfig(format="%(message)s")
+        step_logger.setLevel(logging.DEBUG)
+    else:
+        step_logger.setLevel(logging.INFO)
+    
+    # Storage state captured after the first admin login; scenarios tagged
+    # @reuse_auth start from it instead of logging in again
+    context.auth_state_path = os.path.join(os.path.dirname(__file__), '..', '.auth', f'state_{WORKER_ID}.json')
+    if os.path.exists(context.auth_state_path):
+        os.remove(context.auth_state_path)
+    
+    # The browser is launched lazily by the first web scenario and shared
+    # across scenarios; each scenario gets a (pooled) browser context
+    from web_playwright.playwright_manager import PlaywrightManager
+    context.playwright_manager = PlaywrightManager()
+    
+    # Failure screenshots are written to disk in the background
+    context.io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="artifact-writer")
+    
     # Set up context attributes
     context.test_results = []
     context.failed_scenarios = []
+    # Mutable container: behave discards attributes rebound inside scenario hooks
+    context.scenario_counts = {'passed': 0}
     
     print("=" * 80)
     print("CENTRAL QUALITY HUB - WEB AUTOMATION TESTING (PLAYWRIGHT)")
@@ -21,62 +81,91 @@ def before_all(context):
 def before_scenario(context, scenario):
     """Setup before each scenario"""
     # Initialize Playwright for web scenarios
-    if any(tag in scenario.tags for tag in ['web', 'playwright', 'login', 'user_management']):
-        from web_playwright.playwright_manager import PlaywrightManager
-        
+    if not WEB_TAGS.isdisjoint(scenario.tags):
         browser = getattr(context, 'browser', 'chromium')
-        headless = getattr(context, 'headless', False)
+        # Always headless on CI agents
+        headless = getattr(context, 'headless', False) or bool(os.environ.get('CI'))
         
-        context.playwright_manager = PlaywrightManager()
-        context.playwright_manager.start_playwright()
-        context.playwright_manager.launch_browser(browser_name=browser, headless=headless)
-        context.playwright_manager.create_context()
+        if not context.playwright_manager.browser:
+            context.playwright_manager.launch_browser(browser_name=browser, headless=headless, slow_mo=SLOW_MO)
+        context.auth_reused = 'reuse_auth' in scenario.tags and os.path.exists(context.auth_state_path)
+        context.playwright_manager.create_context(
+            storage_state=context.auth_state_path if context.auth_reused else None,
+            record_video_dir=os.path.join(os.path.dirname(__file__), '..', 'videos') if RECORD_VIDEO else None
+        )
+        if TRACE_SCENARIOS:
+            context.playwright_manager.context.tracing.start(screenshots=True, snapshots=True, sources=True)
         context.playwright_manager.create_page()
         
+        # Page objects are built lazily on first use within the scenario
+        from pageobjects import Pages
+        context.pages = Pages(context.playwright_manager)
+        
         # Set default timeouts
         context.playwright_manager.page.set_default_timeout(30000)
         
+        # Computed once so every artifact of this scenario shares one timestamp
+        context._scenario_timestamp = context.playwright_manager.get_timestamp()
+        
         print(f"\n🎭 Starting Playwright Scenario: {scenario.name}")
         print(f"Browser: {browser.upper()}")
 
 
 def after_scenario(context, scenario):
     """Cleanup after each scenario"""
-    # Close Playwright resources for web scenarios
-    if hasattr(context, 'playwright_manager'):
+    # Release Playwright resources for web scenarios
+    manager = getattr(context, 'playwright_manager', None)
+    if manager is not None and manager.context:
         try:
+            # Only failed scenarios keep their trace
+            if TRACE_SCENARIOS:
+                trace_path = None
+                if scenario.status == 'failed':
+                    trace_dir = os.path.join(os.path.dirname(__file__), '..', 'traces')
+                    os.makedirs(trace_dir, exist_ok=True)
+                    trace_path = os.path.join(trace_dir, f"{scenario.name}_{context._scenario_timestamp}.zip")
+                manager.context.tracing.stop(path=trace_path)
+            
             # Take screenshot on failure
             if scenario.status == 'failed':
                 screenshot_dir = os.path.join(os.path.dirname(__file__), '..', 'screenshots')
                 os.makedirs(screenshot_dir, exist_ok=True)
-                screenshot_path = os.path.join(screenshot_dir, f"{scenario.name}_{context.playwright_manager.get_timestamp()}.png")
-                context.playwright_manager.page.screenshot(path=screenshot_path)
+                screenshot_path = os.path.join(screenshot_dir, f"{scenario.name}_{context._scenario_timestamp}.png")
+                screenshot = manager.page.screenshot()
+                context.io_executor.submit(Path(screenshot_path).write_bytes, screenshot)
                 print(f"📸 Screenshot saved: {screenshot_path}")
             
-            context.playwright_manager.close_all()
             print(f"✅ Playwright Scenario completed: {scenario.name}")
         except Exception as e:
             print(f"⚠️ Error closing Playwright: {e}")
         finally:
-            if hasattr(context, 'playwright_manager'):
-                delattr(context, 'playwright_manager')
+            manager.release_context()
     
     # Record test results
-    context.test_results.append({
-        'scenario': scenario.name,
-        'status': scenario.status,
-        'tags': scenario.tags
-    })
+    context.test_results.append(ScenarioResult(scenario.name, scenario.status, tuple(scenario.tags)))
     
-    if scenario.status == 'failed':
+    if scenario.status == 'passed':
+        context.scenario_counts['passed'] += 1
+    elif scenario.status == 'failed':
         context.failed_scenarios.append(scenario.name)
 
 
 def after_all(context):
     """Cleanup after all scenarios"""
+    # Shut down the shared browser and any pooled contexts
+    manager = getattr(context, 'playwright_manager', None)
+    if manager is not None:
+        manager.quit()
+    
+    if os.path.exists(context.auth_state_path):
+        os.remove(context.auth_state_path)
+    
+    # Flush any screenshots still being written
+    context.io_executor.shutdown(wait=True)
+    
     # Print test summary
     total_scenarios = len(context.test_results)
-    passed_scenarios = len([r for r in context.test_results if r['status'] == 'passed'])
+    passed_scenarios = context.scenario_counts['passed']
     failed_scenarios = len(context.failed_scenarios)
     
     print("\n" + "=" * 80)
@@ -109,13 +198,14 @@ def after_feature(context, feature):
 
 def before_step(context, step):
     """Setup before each step"""
-    print(f"  📝 {step.step_type.title()}: {step.name}")
+    if step_logger.isEnabledFor(logging.DEBUG):
+        step_logger.debug("  📝 %s: %s", step.step_type.title(), step.name)
 
 
 def after_step(context, step):
     """Cleanup after each step"""
     if step.status == 'failed':
-        print(f"  ❌ Step failed: {step.name}")
+        step_logger.error("  ❌ Step failed: %s", step.name)
         # You can add additional error logging here
-    elif step.status == 'passed':
-        print(f"  ✅ Step passed: {step.name}")
+    elif step.status == 'passed' and step_logger.isEnabledFor(logging.DEBUG):
+        step_logger.debug("  ✅ Step passed: %s", step.name)
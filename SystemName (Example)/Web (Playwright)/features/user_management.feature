@@ -1,4 +1,4 @@
-@user_management @web @playwright
+@user_management @web @playwright @reuse_auth
 Feature: User Management with Playwright
   As an administrator
   I want to manage users in the system using Playwright
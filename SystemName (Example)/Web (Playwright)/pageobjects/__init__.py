@@ -5,12 +5,40 @@ This package contains all page object classes for the Playwright web automation
 following the Page Object Model pattern.
 """
 
+from functools import cached_property
+
 from .login_page import LoginPage
 from .home_page import HomePage
 from .user_management_page import UserManagementPage
 
+
+class Pages:
+    """
+    Page objects for a single scenario, constructed on first access.
+    
+    Args:
+        playwright_manager: Playwright manager whose page the objects drive
+    """
+    
+    def __init__(self, playwright_manager):
+        self.playwright_manager = playwright_manager
+    
+    @cached_property
+    def login_page(self) -> LoginPage:
+        return LoginPage(self.playwright_manager)
+    
+    @cached_property
+    def home_page(self) -> HomePage:
+        return HomePage(self.playwright_manager)
+    
+    @cached_property
+    def user_management_page(self) -> UserManagementPage:
+        return UserManagementPage(self.playwright_manager)
+
+
 __all__ = [
     'LoginPage',
     'HomePage',
-    'UserManagementPage'
+    'UserManagementPage',
+    'Pages'
 ]
@@ -7,11 +7,13 @@ with the home page elements using Playwright automation.
 
 import sys
 import os
+from pathlib import Path
 from typing import Optional, List
 
 # Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from playwright.sync_api import Page, Locator, expect
 from web_playwright.base_page import BasePage
@@ -100,7 +102,7 @@ class HomePage(BasePage):
         """Perform complete logout operation."""
         try:
             self.click_user_profile_dropdown()
-            self.wait_for_element(self.LOGOUT_BUTTON)
+            # Locator.click() auto-waits for the button to become actionable
             self.click_logout_button()
             self.logger.info("Performed logout")
         except Exception as e:
@@ -142,15 +144,15 @@ class HomePage(BasePage):
             bool: True if all elements are present, False otherwise
         """
         try:
-            elements_to_check = [
+            visibility = self.are_elements_visible([
                 self.NAVIGATION_MENU,
                 self.MAIN_CONTENT
-            ]
+            ])
             
-            for element in elements_to_check:
-                if not self.is_visible(element):
-                    self.logger.error(f"Element not visible: {element}")
-                    return False
+            missing = [selector for selector, visible in visibility.items() if not visible]
+            if missing:
+                self.logger.error(f"Elements not visible: {missing}")
+                return False
             
             self.logger.info("All home page elements are present")
             return True
@@ -158,12 +160,12 @@ class HomePage(BasePage):
             self.logger.error(f"Failed to verify home page elements: {e}")
             return False
     
-    def wait_for_page_load(self, timeout: int = 30000):
+    def wait_for_page_load(self, timeout: int = None):
         """
         Wait for the home page to fully load.
         
         Args:
-            timeout (int): Timeout in milliseconds
+            timeout (int): Timeout in milliseconds, defaults to BEHAVE_PW_TIMEOUT
         """
         try:
             # Wait for the main content to be visible as an indicator of page load
@@ -181,14 +183,14 @@ class HomePage(BasePage):
             bool: True if on home page, False otherwise
         """
         try:
-            current_url = self.get_current_url()
-            title = self.page.title()
+            # Cheapest checks first; the element scan only runs as a fallback
+            if self.PAGE_URL_PATTERN in self.get_current_url():
+                return True
             
-            url_check = self.PAGE_URL_PATTERN in current_url
-            title_check = self.PAGE_TITLE.lower() in title.lower()
-            elements_check = self.verify_home_page_elements()
+            if self.PAGE_TITLE.lower() in self.get_page_title().lower():
+                return True
             
-            return url_check or title_check or elements_check
+            return self.verify_home_page_elements()
         except Exception as e:
             self.logger.error(f"Failed to verify home page: {e}")
             return False
@@ -7,12 +7,14 @@ with the login page elements using Playwright automation.
 
 import sys
 import os
+from pathlib import Path
 from typing import Optional
 import time
 
 # Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from playwright.sync_api import Page, Locator, expect
 from web_playwright.base_page import BasePage
@@ -209,6 +211,7 @@ class LoginPage(BasePage):
                 self.check_remember_me()
                 
             self.click_login_button()
+            self.bump_nav_epoch()
             self.logger.info(f"Performed login for user: {username}")
         except Exception as e:
             self.logger.error(f"Failed to perform login: {e}")
@@ -222,16 +225,16 @@ class LoginPage(BasePage):
             bool: True if all elements are present, False otherwise
         """
         try:
-            elements_to_check = [
+            visibility = self.are_elements_visible([
                 self.USERNAME_FIELD,
                 self.PASSWORD_FIELD,
                 self.LOGIN_BUTTON
-            ]
+            ])
             
-            for element in elements_to_check:
-                if not self.is_visible(element):
-                    self.logger.error(f"Element not visible: {element}")
-                    return False
+            missing = [selector for selector, visible in visibility.items() if not visible]
+            if missing:
+                self.logger.error(f"Elements not visible: {missing}")
+                return False
             
             self.logger.info("All login page elements are present")
             return True
@@ -239,12 +242,12 @@ class LoginPage(BasePage):
             self.logger.error(f"Failed to verify login page elements: {e}")
             return False
     
-    def wait_for_page_load(self, timeout: int = 30000):
+    def wait_for_page_load(self, timeout: int = None):
         """
         Wait for the login page to fully load.
         
         Args:
-            timeout (int): Timeout in milliseconds
+            timeout (int): Timeout in milliseconds, defaults to BEHAVE_PW_TIMEOUT
         """
         try:
             # Wait for the login button to be visible as an indicator of page load
@@ -276,9 +279,8 @@ class LoginPage(BasePage):
             str: Page title
         """
         try:
-            return self.page.title()
-        except Exception as e:
-            self.logger.error(f"Failed to get page title: {e}")
+            return super().get_page_title()
+        except Exception:
             return ""
     
     def is_on_login_page(self) -> bool:
@@ -289,14 +291,14 @@ class LoginPage(BasePage):
             bool: True if on login page, False otherwise
         """
         try:
-            current_url = self.get_current_url()
-            title = self.get_page_title()
+            # Cheapest checks first; the element scan only runs as a fallback
+            if self.PAGE_URL_PATTERN in self.get_current_url():
+                return True
             
-            url_check = self.PAGE_URL_PATTERN in current_url
-            title_check = self.PAGE_TITLE.lower() in title.lower()
-            elements_check = self.verify_login_page_elements()
+            if self.PAGE_TITLE.lower() in self.get_page_title().lower():
+                return True
             
-            return url_check or title_check or elements_check
+            return self.verify_login_page_elements()
         except Exception as e:
             self.logger.error(f"Failed to verify login page: {e}")
             return False
@@ -7,11 +7,13 @@ with the user management page elements using Playwright automation.
 
 import sys
 import os
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 # Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
 from playwright.sync_api import Page, Locator, expect
 from web_playwright.base_page import BasePage
@@ -46,6 +48,7 @@ class UserManagementPage(BasePage):
     
     # User table selectors
     USER_ROW = ".user-row, tbody tr"
+    USER_ROW_BY_USERNAME = 'tr[data-username="{username}"], .user-row[data-username="{username}"]'
     EDIT_BUTTON = "button:has-text('Edit'), .edit-btn"
     DELETE_BUTTON = "button:has-text('Delete'), .delete-btn"
     
@@ -77,6 +80,19 @@ class UserManagementPage(BasePage):
         """
         super().__init__(playwright_manager)
         self.page_url = "https://example.com/user-management"  # Default URL
+        
+        # Row locators keyed by (page URL, username); cleared when the table changes
+        self._row_locator_cache: Dict[Tuple[str, str], Locator] = {}
+        # Row counts keyed by navigation epoch and page URL; cleared when the table changes
+        self._user_count_cache: Dict[Tuple[int, str], int] = {}
+        # Usernames of all rows keyed by page URL; None when a row has no username
+        self._usernames_cache: Dict[Tuple[int, str], Optional[Set[str]]] = {}
+    
+    def _invalidate_table_cache(self):
+        """Drop cached row locators and row counts after the table changes."""
+        self._row_locator_cache.clear()
+        self._user_count_cache.clear()
+        self._usernames_cache.clear()
     
     def click_add_user_button(self):
         """Click the add new user button."""
@@ -84,7 +100,7 @@ class UserManagementPage(BasePage):
             self.click_element(self.ADD_USER_BUTTON)
             self.logger.info("Clicked add user button")
         except Exception as e:
-            self.logger.error(f"Failed to click add user button: {e}")
+            self.logger.error("Failed to click add user button: %s", e)
             raise
     
     def fill_user_form(self, user_data: Dict[str, str]):
@@ -95,42 +111,45 @@ class UserManagementPage(BasePage):
             user_data (Dict[str, str]): Dictionary containing user data
         """
         try:
+            # fill() sets each value in one input event instead of one event per keystroke
             if 'username' in user_data:
-                self.type_text(self.USERNAME_INPUT, user_data['username'])
+                self.fill_text(self.USERNAME_INPUT, user_data['username'])
             
             if 'email' in user_data:
-                self.type_text(self.EMAIL_INPUT, user_data['email'])
+                self.fill_text(self.EMAIL_INPUT, user_data['email'])
             
             if 'first_name' in user_data:
-                self.type_text(self.FIRST_NAME_INPUT, user_data['first_name'])
+                self.fill_text(self.FIRST_NAME_INPUT, user_data['first_name'])
             
             if 'last_name' in user_data:
-                self.type_text(self.LAST_NAME_INPUT, user_data['last_name'])
+                self.fill_text(self.LAST_NAME_INPUT, user_data['last_name'])
             
             if 'role' in user_data:
                 self.select_option(self.ROLE_SELECT, user_data['role'])
             
             self.logger.info("Filled user form with provided data")
         except Exception as e:
-            self.logger.error(f"Failed to fill user form: {e}")
+            self.logger.error("Failed to fill user form: %s", e)
             raise
     
     def click_create_user_button(self):
         """Click the create user button."""
         try:
             self.click_element(self.CREATE_USER_BUTTON)
+            self._invalidate_table_cache()
             self.logger.info("Clicked create user button")
         except Exception as e:
-            self.logger.error(f"Failed to click create user button: {e}")
+            self.logger.error("Failed to click create user button: %s", e)
             raise
     
     def click_save_changes_button(self):
         """Click the save changes button."""
         try:
             self.click_element(self.SAVE_CHANGES_BUTTON)
+            self._invalidate_table_cache()
             self.logger.info("Clicked save changes button")
         except Exception as e:
-            self.logger.error(f"Failed to click save changes button: {e}")
+            self.logger.error("Failed to click save changes button: %s", e)
             raise
     
     def search_user(self, search_term: str):
@@ -143,9 +162,10 @@ class UserManagementPage(BasePage):
         try:
             self.type_text(self.SEARCH_FIELD, search_term)
             self.click_element(self.SEARCH_BUTTON)
-            self.logger.info(f"Searched for user: {search_term}")
+            self._invalidate_table_cache()
+            self.logger.info("Searched for user: %s", search_term)
         except Exception as e:
-            self.logger.error(f"Failed to search for user: {e}")
+            self.logger.error("Failed to search for user: %s", e)
             raise
     
     def filter_by_role(self, role: str):
@@ -157,9 +177,10 @@ class UserManagementPage(BasePage):
         """
         try:
             self.select_option(self.ROLE_FILTER_DROPDOWN, role)
-            self.logger.info(f"Filtered users by role: {role}")
+            self._invalidate_table_cache()
+            self.logger.info("Filtered users by role: %s", role)
         except Exception as e:
-            self.logger.error(f"Failed to filter by role: {e}")
+            self.logger.error("Failed to filter by role: %s", e)
             raise
     
     def get_user_row_by_username(self, username: str) -> Locator:
@@ -173,11 +194,36 @@ class UserManagementPage(BasePage):
             Locator: User row locator
         """
         try:
-            return self.page.locator(f"{self.USER_ROW}:has-text('{username}')")
+            key = (self.page.url, username)
+            row = self._row_locator_cache.get(key)
+            if row is None:
+                # Attribute match is a single compare per row; the text scan walks
+                # each row's whole subtree, so it is only used when the table
+                # does not expose data-username
+                quoted = username.replace('\\', '\\\\').replace('"', '\\"')
+                row = self.page.locator(self.USER_ROW_BY_USERNAME.format(username=quoted))
+                if row.count() == 0:
+                    # filter() applies to every alternative in USER_ROW, unlike appending :has-text
+                    row = self._loc(self.USER_ROW).filter(has_text=username)
+                self._row_locator_cache[key] = row
+            return row
         except Exception as e:
-            self.logger.error(f"Failed to get user row for username {username}: {e}")
+            self.logger.error("Failed to get user row for username %s: %s", username, e)
             raise
     
+    def _get_row_button(self, username: str, button_selector: str) -> Locator:
+        """
+        Get a button inside the table row of a user, chained off the cached row locator.
+        
+        Args:
+            username (str): Username identifying the row
+            button_selector (str): Button selector, e.g. EDIT_BUTTON
+            
+        Returns:
+            Locator: Button locator
+        """
+        return self.get_user_row_by_username(username).locator(button_selector)
+    
     def click_edit_button_for_user(self, username: str):
         """
         Click edit button for specific user.
@@ -186,12 +232,10 @@ class UserManagementPage(BasePage):
             username (str): Username of user to edit
         """
         try:
-            user_row = self.get_user_row_by_username(username)
-            edit_button = user_row.locator(self.EDIT_BUTTON)
-            edit_button.click()
-            self.logger.info(f"Clicked edit button for user: {username}")
+            self._get_row_button(username, self.EDIT_BUTTON).click()
+            self.logger.info("Clicked edit button for user: %s", username)
         except Exception as e:
-            self.logger.error(f"Failed to click edit button for user {username}: {e}")
+            self.logger.error("Failed to click edit button for user %s: %s", username, e)
             raise
     
     def click_delete_button_for_user(self, username: str):
@@ -202,60 +246,106 @@ class UserManagementPage(BasePage):
             username (str): Username of user to delete
         """
         try:
-            user_row = self.get_user_row_by_username(username)
-            delete_button = user_row.locator(self.DELETE_BUTTON)
-            delete_button.click()
-            self.logger.info(f"Clicked delete button for user: {username}")
+            self._get_row_button(username, self.DELETE_BUTTON).click()
+            self.logger.info("Clicked delete button for user: %s", username)
         except Exception as e:
-            self.logger.error(f"Failed to click delete button for user {username}: {e}")
+            self.logger.error("Failed to click delete button for user %s: %s", username, e)
             raise
     
     def confirm_deletion(self):
         """Confirm deletion in the confirmation dialog."""
         try:
-            self.wait_for_element(self.CONFIRMATION_DIALOG)
+            # Locator.click() auto-waits for the dialog button to become actionable
             self.click_element(self.CONFIRM_DELETE_BUTTON)
+            self._invalidate_table_cache()
             self.logger.info("Confirmed deletion")
         except Exception as e:
-            self.logger.error(f"Failed to confirm deletion: {e}")
+            self.logger.error("Failed to confirm deletion: %s", e)
             raise
     
     def cancel_deletion(self):
         """Cancel deletion in the confirmation dialog."""
         try:
-            self.wait_for_element(self.CONFIRMATION_DIALOG)
+            # Locator.click() auto-waits for the dialog button to become actionable
             self.click_element(self.CANCEL_DELETE_BUTTON)
             self.logger.info("Cancelled deletion")
         except Exception as e:
-            self.logger.error(f"Failed to cancel deletion: {e}")
+            self.logger.error("Failed to cancel deletion: %s", e)
             raise
     
-    def get_success_message(self) -> str:
+    def _get_message_text(self, selector: str, expected: bool) -> str:
+        """Get the text of the first message matching selector, waiting for it only if expected."""
+        message = self._loc(selector).first
+        if expected:
+            # A message shown in response to a click may still be rendering
+            message.wait_for(state="visible", timeout=self.wait_timeout)
+        elif message.count() == 0:
+            # count() does not auto-wait, so an absent message returns at once
+            return ""
+        return message.text_content(timeout=500) or ""
+    
+    def get_success_message(self, expected: bool = True) -> str:
         """
         Get success message text.
         
+        Args:
+            expected (bool): Wait up to the wait timeout for the message to render.
+                Pass False to only check whether one is shown right now.
+        
         Returns:
-            str: Success message text
+            str: Success message text, or "" if there is none
         """
         try:
-            return self.get_text(self.SUCCESS_MESSAGE)
+            return self._get_message_text(self.SUCCESS_MESSAGE, expected)
         except Exception as e:
-            self.logger.error(f"Failed to get success message: {e}")
+            self.logger.error("Failed to get success message: %s", e)
             return ""
     
-    def get_error_message(self) -> str:
+    def get_error_message(self, expected: bool = True) -> str:
         """
         Get error message text.
         
+        Args:
+            expected (bool): Wait up to the wait timeout for the message to render.
+                Pass False to only check whether one is shown right now.
+        
         Returns:
-            str: Error message text
+            str: Error message text, or "" if there is none
         """
         try:
-            return self.get_text(self.ERROR_MESSAGE)
+            return self._get_message_text(self.ERROR_MESSAGE, expected)
         except Exception as e:
-            self.logger.error(f"Failed to get error message: {e}")
+            self.logger.error("Failed to get error message: %s", e)
             return ""
     
+    def get_all_usernames(self) -> Optional[Set[str]]:
+        """
+        Get the usernames of all rows in the user table with one evaluate_all call.
+        
+        Returns:
+            Optional[Set[str]]: Usernames in the table, or None if some row exposes
+            neither a data-username attribute nor a .username cell
+        """
+        try:
+            key = (self._nav_epoch, self.page.url)
+            if key in self._usernames_cache:
+                return self._usernames_cache[key]
+            names = self._loc(self.USER_ROW).evaluate_all(
+                """rows => rows.map(r => {
+                    if (r.dataset.username) return r.dataset.username;
+                    const cell = r.querySelector('.username');
+                    return cell ? cell.textContent.trim() : null;
+                })"""
+            )
+            usernames = None if None in names else set(names)
+            # An empty scrape may be a table that has not rendered yet; do not keep it
+            if names:
+                self._usernames_cache[key] = usernames
+            return usernames
+        except Exception as e:
+            self.logger.error("Failed to get usernames from table: %s", e)
+            return None
+    
     def is_user_in_table(self, username: str) -> bool:
         """
         Check if user exists in the user table.
@@ -267,10 +357,15 @@ class UserManagementPage(BasePage):
             bool: True if user exists, False otherwise
         """
         try:
-            user_row = self.get_user_row_by_username(username)
-            return user_row.count() > 0
+            # One scrape of the table answers every membership check until it changes
+            usernames = self.get_all_usernames()
+            if usernames is not None:
+                return username in usernames
+            
+            # Stops at the first matching row instead of counting every match
+            return self.get_user_row_by_username(username).first.is_visible()
         except Exception as e:
-            self.logger.error(f"Failed to check if user {username} exists in table: {e}")
+            self.logger.error("Failed to check if user %s exists in table: %s", username, e)
             return False
     
     def get_user_count(self) -> int:
@@ -281,27 +376,36 @@ class UserManagementPage(BasePage):
             int: Number of users
         """
         try:
-            return self.page.locator(self.USER_ROW).count()
+            key = (self._nav_epoch, self.page.url)
+            count = self._user_count_cache.get(key)
+            if count is None:
+                count = self._loc(self.USER_ROW).count()
+                self._user_count_cache[key] = count
+            return count
         except Exception as e:
-            self.logger.error(f"Failed to get user count: {e}")
+            self.logger.error("Failed to get user count: %s", e)
             return 0
     
     def click_next_page(self):
         """Click next page button in pagination."""
         try:
             self.click_element(self.NEXT_PAGE_BUTTON)
+            self._invalidate_table_cache()
+            self.bump_nav_epoch()
             self.logger.info("Clicked next page button")
         except Exception as e:
-            self.logger.error(f"Failed to click next page button: {e}")
+            self.logger.error("Failed to click next page button: %s", e)
             raise
     
     def click_previous_page(self):
         """Click previous page button in pagination."""
         try:
             self.click_element(self.PREVIOUS_PAGE_BUTTON)
+            self._invalidate_table_cache()
+            self.bump_nav_epoch()
             self.logger.info("Clicked previous page button")
         except Exception as e:
-            self.logger.error(f"Failed to click previous page button: {e}")
+            self.logger.error("Failed to click previous page button: %s", e)
             raise
     
     def get_current_page_number(self) -> str:
@@ -314,7 +418,7 @@ class UserManagementPage(BasePage):
         try:
             return self.get_text(self.PAGE_NUMBER)
         except Exception as e:
-            self.logger.error(f"Failed to get current page number: {e}")
+            self.logger.error("Failed to get current page number: %s", e)
             return ""
     
     def verify_user_management_page_elements(self) -> bool:
@@ -325,36 +429,42 @@ class UserManagementPage(BasePage):
             bool: True if all elements are present, False otherwise
         """
         try:
-            elements_to_check = [
+            visibility = self.are_elements_visible([
                 self.ADD_USER_BUTTON,
                 self.USER_TABLE,
                 self.SEARCH_FIELD
-            ]
+            ])
             
-            for element in elements_to_check:
-                if not self.is_visible(element):
-                    self.logger.error(f"Element not visible: {element}")
-                    return False
+            missing = [selector for selector, visible in visibility.items() if not visible]
+            if missing:
+                self.logger.error("Elements not visible: %s", missing)
+                return False
             
             self.logger.info("All user management page elements are present")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to verify user management page elements: {e}")
+            self.logger.error("Failed to verify user management page elements: %s", e)
             return False
     
-    def wait_for_page_load(self, timeout: int = 30000):
+    def wait_for_page_load(self, timeout: int = None):
         """
         Wait for the user management page to fully load.
         
         Args:
-            timeout (int): Timeout in milliseconds
+            timeout (int): Timeout in milliseconds, defaults to BEHAVE_PW_TIMEOUT
         """
         try:
-            # Wait for the user table to be visible as an indicator of page load
-            self.wait_for_element(self.USER_TABLE, timeout=timeout)
+            # Wait for the user table to be visible as an indicator of page load.
+            # The predicate runs in the page on each animation frame, so it
+            # resolves right after the table renders without a CDP poll loop.
+            self.page.wait_for_function(
+                "sel => { const el = document.querySelector(sel); return !!el && el.getClientRects().length > 0; }",
+                arg=self.USER_TABLE,
+                timeout=timeout or self.wait_timeout
+            )
             self.logger.info("User management page loaded successfully")
         except Exception as e:
-            self.logger.error(f"User management page failed to load: {e}")
+            self.logger.error("User management page failed to load: %s", e)
             raise
     
     def is_on_user_management_page(self) -> bool:
@@ -365,14 +475,22 @@ class UserManagementPage(BasePage):
             bool: True if on user management page, False otherwise
         """
         try:
-            current_url = self.get_current_url()
-            title = self.page.title()
+            # page.url is tracked client-side, so the URL check needs no round-trip
+            if self.PAGE_URL_PATTERN in self.get_current_url():
+                return True
             
-            url_check = self.PAGE_URL_PATTERN in current_url
-            title_check = self.PAGE_TITLE.lower() in title.lower()
-            elements_check = self.verify_user_management_page_elements()
+            # A title fetched earlier in this navigation epoch answers without a round-trip
+            cached_key, title = self._title_cache
+            if cached_key == (self._nav_epoch, self.page.url) and self.PAGE_TITLE.lower() in title.lower():
+                return True
             
-            return url_check or title_check or elements_check
+            # Title and element visibility are fetched together in one evaluate call
+            title, visibility = self.get_page_state([
+                self.ADD_USER_BUTTON,
+                self.USER_TABLE,
+                self.SEARCH_FIELD
+            ])
+            return self.PAGE_TITLE.lower() in title.lower() or all(visibility.values())
         except Exception as e:
-            self.logger.error(f"Failed to verify user management page: {e}")
+            self.logger.error("Failed to verify user management page: %s", e)
             return False
@@ -8,15 +8,34 @@ using the Page Object Model pattern with Playwright.
 from behave import given, when, then
 import sys
 import os
-import time
+from pathlib import Path
 
 # Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+base_dir = str(Path(__file__).resolve().parents[3] / 'base')
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from web_playwright.base_page import BasePage
 from web_playwright.playwright_manager import PlaywrightManager
 
+# Expected texts at least this long are matched with an XPath over each
+# element's normalized text, which also finds text split across child elements
+LONG_TEXT_THRESHOLD = 30
+
+_UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _xpath_literal(value):
+    """Quote a string for use as an XPath 1.0 literal."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
 
 # Login Page Steps
 
@@ -29,15 +48,11 @@ def step_navigate_to_login_page_playwright(context):
         context: Behave context object containing shared data
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        context.login_page.navigate_to_login_page()
-        context.login_page.wait_for_page_load()
+        # navigate_to_login_page() already waits for the login button
+        context.pages.login_page.navigate_to_login_page()
         
         # Verify we're actually on the login page
-        assert context.login_page.verify_login_page_elements(), "Login page elements are not properly loaded"
+        assert context.pages.login_page.verify_login_page_elements(), "Login page elements are not properly loaded"
         
     except Exception as e:
         context.test_failed = True
@@ -55,12 +70,8 @@ def step_enter_credentials_playwright(context, username, password):
         password (str): Password to enter
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        context.login_page.enter_username(username)
-        context.login_page.enter_password(password)
+        context.pages.login_page.enter_username(username)
+        context.pages.login_page.enter_password(password)
         
     except Exception as e:
         context.test_failed = True
@@ -76,11 +87,7 @@ def step_click_login_button_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        context.login_page.click_login_button()
+        context.pages.login_page.click_login_button()
         
     except Exception as e:
         context.test_failed = True
@@ -96,11 +103,7 @@ def step_check_remember_me_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        context.login_page.check_remember_me()
+        context.pages.login_page.check_remember_me()
         
     except Exception as e:
         context.test_failed = True
@@ -116,12 +119,8 @@ def step_verify_home_page_redirect_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'home_page'):
-            from SystemName.Web.pageobjects.home_page import HomePage
-            context.home_page = HomePage(context.playwright_manager)
-        
-        context.home_page.wait_for_page_load()
-        assert context.home_page.is_on_home_page(), "User was not redirected to home page"
+        context.pages.home_page.wait_for_page_load()
+        assert context.pages.home_page.is_on_home_page(), "User was not redirected to home page"
         
     except Exception as e:
         context.test_failed = True
@@ -137,11 +136,7 @@ def step_verify_welcome_message_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'home_page'):
-            from SystemName.Web.pageobjects.home_page import HomePage
-            context.home_page = HomePage(context.playwright_manager)
-        
-        assert context.home_page.verify_welcome_message(), "Welcome message is not displayed"
+        assert context.pages.home_page.verify_welcome_message(), "Welcome message is not displayed"
         
     except Exception as e:
         context.test_failed = True
@@ -158,12 +153,8 @@ def step_verify_error_message_playwright(context, error_message):
         error_message (str): Expected error message
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        context.login_page.wait_for_error_message()
-        actual_message = context.login_page.get_error_message()
+        context.pages.login_page.wait_for_error_message()
+        actual_message = context.pages.login_page.get_error_message()
         
         assert error_message.lower() in actual_message.lower(), \
             f"Expected error message '{error_message}' not found in '{actual_message}'"
@@ -182,11 +173,7 @@ def step_verify_remain_on_login_page_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        assert context.login_page.is_on_login_page(), "User did not remain on login page"
+        assert context.pages.login_page.is_on_login_page(), "User did not remain on login page"
         
     except Exception as e:
         context.test_failed = True
@@ -202,11 +189,7 @@ def step_verify_remember_me_selected_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        assert context.login_page.is_remember_me_checked(), "Remember me checkbox is not checked"
+        assert context.pages.login_page.is_remember_me_checked(), "Remember me checkbox is not checked"
         
     except Exception as e:
         context.test_failed = True
@@ -224,15 +207,26 @@ def step_login_as_admin_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'login_page'):
-            from SystemName.Web.pageobjects.login_page import LoginPage
-            context.login_page = LoginPage(context.playwright_manager)
-        
-        context.login_page.navigate_to_login_page()
-        context.login_page.perform_login("admin_user", "admin_password")
-        
-        # Wait for login to complete
-        time.sleep(2)
+        stale_auth = False
+        if getattr(context, 'auth_reused', False):
+            # Session restored from the saved storage state, skip the login form
+            context.playwright_manager.navigate_to(context.pages.home_page.page_url)
+            try:
+                context.pages.home_page.wait_for_page_load()
+                return
+            except Exception:
+                # The saved session has expired; log in through the form instead
+                stale_auth = True
+        
+        context.pages.login_page.navigate_to_login_page()
+        context.pages.login_page.perform_login("admin_user", "admin_password")
+        
+        # Wait for the home page instead of sleeping a fixed interval
+        context.pages.home_page.wait_for_page_load()
+        
+        # Capture the authenticated session for @reuse_auth scenarios
+        if stale_auth or not os.path.exists(context.auth_state_path):
+            context.playwright_manager.save_storage_state(context.auth_state_path)
         
     except Exception as e:
         context.test_failed = True
@@ -248,16 +242,8 @@ def step_navigate_to_user_management_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'user_management_page'):
-            from SystemName.Web.pageobjects.user_management_page import UserManagementPage
-            context.user_management_page = UserManagementPage(context.playwright_manager)
-        
-        if not hasattr(context, 'home_page'):
-            from SystemName.Web.pageobjects.home_page import HomePage
-            context.home_page = HomePage(context.playwright_manager)
-        
-        context.home_page.navigate_to_user_management()
-        context.user_management_page.wait_for_page_load()
+        context.pages.home_page.navigate_to_user_management()
+        context.pages.user_management_page.wait_for_page_load()
         
     except Exception as e:
         context.test_failed = True
@@ -273,11 +259,7 @@ def step_click_add_new_user_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'user_management_page'):
-            from SystemName.Web.pageobjects.user_management_page import UserManagementPage
-            context.user_management_page = UserManagementPage(context.playwright_manager)
-        
-        context.user_management_page.click_add_user_button()
+        context.pages.user_management_page.click_add_user_button()
         
     except Exception as e:
         context.test_failed = True
@@ -293,16 +275,12 @@ def step_fill_user_creation_form_playwright(context):
         context: Behave context object containing table data
     """
     try:
-        if not hasattr(context, 'user_management_page'):
-            from SystemName.Web.pageobjects.user_management_page import UserManagementPage
-            context.user_management_page = UserManagementPage(context.playwright_manager)
-        
         # Convert table data to dictionary
         user_data = {}
         for row in context.table:
             user_data[row['field']] = row['value']
         
-        context.user_management_page.fill_user_form(user_data)
+        context.pages.user_management_page.fill_user_form(user_data)
         
     except Exception as e:
         context.test_failed = True
@@ -318,11 +296,7 @@ def step_click_create_user_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'user_management_page'):
-            from SystemName.Web.pageobjects.user_management_page import UserManagementPage
-            context.user_management_page = UserManagementPage(context.playwright_manager)
-        
-        context.user_management_page.click_create_user_button()
+        context.pages.user_management_page.click_create_user_button()
         
     except Exception as e:
         context.test_failed = True
@@ -339,11 +313,7 @@ def step_verify_success_message_playwright(context, success_message):
         success_message (str): Expected success message
     """
     try:
-        if not hasattr(context, 'user_management_page'):
-            from SystemName.Web.pageobjects.user_management_page import UserManagementPage
-            context.user_management_page = UserManagementPage(context.playwright_manager)
-        
-        actual_message = context.user_management_page.get_success_message()
+        actual_message = context.pages.user_management_page.get_success_message()
         
         assert success_message.lower() in actual_message.lower(), \
             f"Expected success message '{success_message}' not found in '{actual_message}'"
@@ -362,14 +332,10 @@ def step_verify_user_in_list_playwright(context):
         context: Behave context object
     """
     try:
-        if not hasattr(context, 'user_management_page'):
-            from SystemName.Web.pageobjects.user_management_page import UserManagementPage
-            context.user_management_page = UserManagementPage(context.playwright_manager)
-        
         # Assuming the username was stored from the form data
         username = getattr(context, 'created_username', 'new_test_user')
         
-        assert context.user_management_page.is_user_in_table(username), \
+        assert context.pages.user_management_page.is_user_in_table(username), \
             f"User '{username}' not found in user list"
         
     except Exception as e:
@@ -474,11 +440,23 @@ def step_verify_expected_result_playwright(context, expected_result):
         expected_result (str): Expected result text
     """
     try:
-        # Use page content to search for the expected result
-        page_content = context.playwright_manager.page.content()
-        
-        assert expected_result.lower() in page_content.lower(), \
-            f"Expected result '{expected_result}' not found in page content"
+        page = context.playwright_manager.page
+        
+        # Match in the browser instead of pulling the whole page HTML into Python
+        if len(expected_result) >= LONG_TEXT_THRESHOLD:
+            needle = _xpath_literal(expected_result.lower())
+            xpath = (f"//*[contains(translate(normalize-space(.), '{_UPPERCASE}', '{_LOWERCASE}'), "
+                     f"{needle})]")
+            locator = page.locator(f"xpath={xpath}")
+        else:
+            locator = page.get_by_text(expected_result, exact=False)
+        
+        try:
+            locator.first.wait_for(state="attached", timeout=3000)
+        except PlaywrightTimeoutError:
+            # Last resort for text the in-browser match cannot fold, e.g. non-ASCII case
+            if expected_result.lower() not in page.content().lower():
+                raise AssertionError(f"Expected result '{expected_result}' not found in page content")
         
     except Exception as e:
         context.test_failed = True
@@ -4,10 +4,18 @@ from pathlib import Path
 
 def before_all(context):
     """Setup before all scenarios"""
-    # Add base directory to Python path
-    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'base')
-    if base_dir not in sys.path:
-        sys.path.append(base_dir)
+    # Add the suite directory to Python path for importing page objects
+    suite_dir = str(Path(__file__).resolve().parents[1])
+    if suite_dir not in sys.path:
+        sys.path.append(suite_dir)
+    
+    # One browser is shared by all scenarios and reset between them
+    from base.web_selenium.webdriver_manager import WebDriverManager
+    from pageobjects import Pages
+    context.driver_manager = WebDriverManager()
+    
+    # Page objects live as long as the browser, not just one scenario
+    context.pages = Pages(context.driver_manager)
     
     # Set up context attributes
     context.test_results = []
@@ -22,13 +30,12 @@ def before_scenario(context, scenario):
     """Setup before each scenario"""
     # Initialize web driver for web scenarios
     if any(tag in scenario.tags for tag in ['web', 'login', 'user_management']):
-        from web.webdriver_manager import WebDriverManager
-        
         browser = getattr(context, 'browser', 'chrome')
         headless = getattr(context, 'headless', False)
         
-        context.driver_manager = WebDriverManager()
-        context.driver = context.driver_manager.get_driver(browser, headless=headless)
+        if context.driver_manager.driver is None:
+            context.driver_manager.get_driver(browser, headless=headless)
+        context.driver = context.driver_manager.driver
         
         print(f"\n📱 Starting Web Scenario: {scenario.name}")
         print(f"Browser: {browser.upper()}")
@@ -36,17 +43,16 @@ def before_scenario(context, scenario):
 
 def after_scenario(context, scenario):
     """Cleanup after each scenario"""
-    # Close web driver for web scenarios
+    # Reset the shared browser for web scenarios instead of quitting it
     if hasattr(context, 'driver'):
         try:
-            context.driver.quit()
+            context.driver_manager.reset_session()
             print(f"✅ Web Scenario completed: {scenario.name}")
         except Exception as e:
-            print(f"⚠️ Error closing driver: {e}")
+            print(f"⚠️ Error resetting driver, it will be restarted: {e}")
+            context.driver_manager.quit_driver()
         finally:
             delattr(context, 'driver')
-            if hasattr(context, 'driver_manager'):
-                delattr(context, 'driver_manager')
     
     # Record scenario results
     if scenario.status == "failed":
@@ -64,6 +70,10 @@ def after_scenario(context, scenario):
 
 def after_all(context):
     """Cleanup after all scenarios"""
+    # Quit the shared browser
+    if context.driver_manager.driver is not None:
+        context.driver_manager.quit_driver()
+    
     print("\n" + "=" * 80)
     print("WEB AUTOMATION TEST SUMMARY")
     print("=" * 80)
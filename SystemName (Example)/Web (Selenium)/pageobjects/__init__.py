@@ -0,0 +1,57 @@
+"""
+Page Objects package for Selenium Web Testing
+
+This package contains all page object classes for the Selenium web automation
+following the Page Object Model pattern.
+"""
+
+from .login_page import LoginPage
+from .home_page import HomePage
+from .user_management_page import UserManagementPage
+
+
+class Pages:
+    """
+    Page objects shared by every scenario of a run, constructed on first access.
+    
+    The objects are rebuilt whenever the driver manager starts a new browser.
+    
+    Args:
+        driver_manager: WebDriver manager whose driver the objects drive
+    """
+    
+    def __init__(self, driver_manager):
+        self.driver_manager = driver_manager
+        self._driver = None
+        self._pages = {}
+    
+    def _get(self, page_class):
+        driver = self.driver_manager.driver
+        if driver is not self._driver:
+            self._driver = driver
+            self._pages.clear()
+        
+        page = self._pages.get(page_class)
+        if page is None:
+            page = self._pages[page_class] = page_class(driver)
+        return page
+    
+    @property
+    def login_page(self) -> LoginPage:
+        return self._get(LoginPage)
+    
+    @property
+    def home_page(self) -> HomePage:
+        return self._get(HomePage)
+    
+    @property
+    def user_management_page(self) -> UserManagementPage:
+        return self._get(UserManagementPage)
+
+
+__all__ = [
+    'LoginPage',
+    'HomePage',
+    'UserManagementPage',
+    'Pages'
+]
@@ -5,17 +5,11 @@ This module contains the HomePage class which provides methods to interact
 with the home page elements following the Page Object Model pattern.
 """
 
-import sys
-import os
 from typing import Optional
 
-# Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
-
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from web_selenium.base_page import BasePage
+from base.web_selenium.base_page import BasePage
 
 
 class HomePage(BasePage):
@@ -47,9 +41,9 @@ class HomePage(BasePage):
     SETTINGS_LINK = (By.LINK_TEXT, "Settings")
     PROFILE_LINK = (By.LINK_TEXT, "Profile")
     
-    # Alternative locators for different implementations
-    LOGOUT_BUTTON_ALT = (By.XPATH, "//button[contains(text(), 'Logout')]")
-    WELCOME_MESSAGE_ALT = (By.CSS_SELECTOR, ".welcome, .greeting")
+    # Union locators covering the alternative implementations in a single query
+    LOGOUT_BUTTON_ANY = (By.XPATH, "//*[@id='logout-button'] | //button[contains(text(), 'Logout')]")
+    WELCOME_MESSAGE_ANY = (By.CSS_SELECTOR, ".welcome-message, .welcome, .greeting")
     
     def __init__(self, driver: WebDriver):
         """
@@ -89,8 +83,7 @@ class HomePage(BasePage):
             bool: True if welcome message is visible, False otherwise
         """
         try:
-            return self.is_element_displayed(self.WELCOME_MESSAGE) or \
-                   self.is_element_displayed(self.WELCOME_MESSAGE_ALT)
+            return self.is_element_displayed(self.WELCOME_MESSAGE_ANY)
         except Exception:
             return False
     
@@ -102,10 +95,7 @@ class HomePage(BasePage):
             str: Welcome message text or empty string if not found
         """
         try:
-            if self.is_element_displayed(self.WELCOME_MESSAGE):
-                return self.get_element_text(self.WELCOME_MESSAGE)
-            elif self.is_element_displayed(self.WELCOME_MESSAGE_ALT):
-                return self.get_element_text(self.WELCOME_MESSAGE_ALT)
+            return self._first_displayed_text(self.WELCOME_MESSAGE_ANY)
         except Exception as e:
             self.logger.warning(f"Could not get welcome message text: {e}")
         return ""
@@ -119,12 +109,7 @@ class HomePage(BasePage):
         """
         self.logger.info("Clicking logout button")
         try:
-            if self.is_element_displayed(self.LOGOUT_BUTTON):
-                self.click_element(self.LOGOUT_BUTTON)
-            elif self.is_element_displayed(self.LOGOUT_BUTTON_ALT):
-                self.click_element(self.LOGOUT_BUTTON_ALT)
-            else:
-                raise Exception("Logout button not found")
+            self.click_element(self.LOGOUT_BUTTON_ANY)
         except Exception as e:
             self.logger.error(f"Failed to click logout button: {e}")
             raise
@@ -137,8 +122,7 @@ class HomePage(BasePage):
             bool: True if logout button is visible, False otherwise
         """
         try:
-            return self.is_element_displayed(self.LOGOUT_BUTTON) or \
-                   self.is_element_displayed(self.LOGOUT_BUTTON_ALT)
+            return self.is_element_displayed(self.LOGOUT_BUTTON_ANY)
         except Exception:
             return False
     
@@ -189,15 +173,23 @@ class HomePage(BasePage):
             self.logger.warning(f"Could not get dashboard header text: {e}")
             return ""
     
-    def get_page_text(self) -> str:
+    def get_page_text(self, selector: Optional[str] = None) -> str:
         """
-        Get all text content from the page body.
+        Get all text content from the page body, or from one element of it.
+        
+        Args:
+            selector (str, optional): CSS selector to scope the text to. Defaults to the body.
         
         Returns:
             str: All visible text content from the page
         """
         try:
-            return self.driver.find_element(By.TAG_NAME, "body").text
+            # innerText is read in the browser in one call instead of through Selenium's text atom
+            return self.driver.execute_script(
+                "const el = arguments[0] ? document.querySelector(arguments[0]) : document.body;"
+                "return el ? el.innerText || '' : '';",
+                selector
+            )
         except Exception as e:
             self.logger.warning(f"Could not get page text: {e}")
             return ""
@@ -214,12 +206,13 @@ class HomePage(BasePage):
         """
         self.logger.info(f"Waiting for home page to load (timeout: {timeout}s)")
         try:
-            # Wait for essential elements to be visible
-            self.wait_for_element_to_be_visible(self.DASHBOARD_HEADER, timeout)
+            # The driver polls for the header itself, in a single command
+            with self._implicit_wait(timeout):
+                header = self.driver.find_element(*self.DASHBOARD_HEADER)
             
-            # Optionally wait for welcome message if it exists
-            if self.is_welcome_message_displayed():
-                self.wait_for_element_to_be_visible(self.WELCOME_MESSAGE, timeout)
+            # Only fall back to client-side polling if the header is present but still hidden
+            if not header.is_displayed():
+                self.wait_for_element_visible(self.DASHBOARD_HEADER, timeout)
                 
             self.logger.info("Home page loaded successfully")
         except Exception as e:
@@ -234,11 +227,13 @@ class HomePage(BasePage):
             bool: True if all essential elements are present, False otherwise
         """
         try:
-            # Check for essential elements
-            has_header = bool(self.get_dashboard_header_text())
-            has_logout = self.is_logout_button_displayed()
+            # Check for essential elements in one in-browser probe
+            visible = self._bulk_visible({
+                'header': self.DASHBOARD_HEADER,
+                'logout': self.LOGOUT_BUTTON_ANY,
+            })
             
-            elements_present = has_header and has_logout
+            elements_present = visible['header'] and visible['logout']
             
             if elements_present:
                 self.logger.info("All essential home page elements are present")
@@ -259,11 +254,24 @@ class HomePage(BasePage):
             bool: True if on home page, False otherwise
         """
         try:
-            current_url = self.driver.current_url
+            # Repeat checks against an unchanged page reuse an earlier positive answer;
+            # negatives are not cached, since the same page can still finish rendering
+            fingerprint = self._page_fingerprint()
+            if fingerprint in self._verify_cache:
+                return True
+            
+            # The fingerprint read above already fetched the URL
+            current_url = self._cached_url
             is_home_url = "home" in current_url.lower() or "dashboard" in current_url.lower()
-            has_home_elements = self.verify_home_page_elements()
             
-            return is_home_url and has_home_elements
+            # The element check costs several WebDriver calls, so skip it on a URL mismatch
+            if not is_home_url:
+                return False
+            
+            if not self.verify_home_page_elements():
+                return False
+            self._verify_cache.add(fingerprint)
+            return True
         except Exception as e:
             self.logger.error(f"Error checking if on home page: {e}")
             return False
@@ -5,17 +5,12 @@ This module contains the LoginPage class which provides methods to interact
 with the login page elements following the Page Object Model pattern.
 """
 
-import sys
-import os
 from typing import Optional
 
-# Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
-
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from web_selenium.base_page import BasePage
+from selenium.webdriver.support.ui import WebDriverWait
+from base.web_selenium.base_page import BasePage
 
 
 class LoginPage(BasePage):
@@ -42,9 +37,9 @@ class LoginPage(BasePage):
     FORGOT_PASSWORD_LINK = (By.LINK_TEXT, "Forgot Password?")
     REMEMBER_ME_CHECKBOX = (By.ID, "remember-me")
     
-    # Alternative locators for different login page implementations
-    LOGIN_BUTTON_ALT = (By.XPATH, "//button[@type='submit']")
-    ERROR_MESSAGE_ALT = (By.CSS_SELECTOR, ".alert-danger, .error")
+    # Union locators covering the alternative login page implementations in a single query
+    LOGIN_BUTTON_ANY = (By.CSS_SELECTOR, "#login-button, button[type='submit']")
+    ERROR_MESSAGE_ANY = (By.CSS_SELECTOR, ".error-message, .alert-danger, .error")
     
     def __init__(self, driver: WebDriver):
         """
@@ -85,7 +80,7 @@ class LoginPage(BasePage):
             TimeoutException: If username field is not found
         """
         self.logger.info(f"Entering username: {username}")
-        self.clear_and_type(self.USERNAME_FIELD, username)
+        self.js_set_value(self.USERNAME_FIELD, username)
     
     def enter_password(self, password: str) -> None:
         """
@@ -98,7 +93,7 @@ class LoginPage(BasePage):
             TimeoutException: If password field is not found
         """
         self.logger.info("Entering password")
-        self.clear_and_type(self.PASSWORD_FIELD, password)
+        self.js_set_value(self.PASSWORD_FIELD, password)
     
     def click_login_button(self) -> None:
         """
@@ -118,9 +113,7 @@ class LoginPage(BasePage):
             TimeoutException: If remember me checkbox is not found
         """
         self.logger.info("Checking remember me checkbox")
-        checkbox = self.find_element(self.REMEMBER_ME_CHECKBOX)
-        if not checkbox.is_selected():
-            self.click_element(self.REMEMBER_ME_CHECKBOX)
+        self._set_remember_me(True)
     
     def uncheck_remember_me(self) -> None:
         """
@@ -130,9 +123,37 @@ class LoginPage(BasePage):
             TimeoutException: If remember me checkbox is not found
         """
         self.logger.info("Unchecking remember me checkbox")
+        self._set_remember_me(False)
+    
+    def _set_remember_me(self, desired_state: Optional[bool]) -> bool:
+        """
+        Read, and optionally toggle, the remember me checkbox in a single browser call.
+        
+        Args:
+            desired_state (Optional[bool]): State to put the checkbox in, or None to only read it
+            
+        Returns:
+            bool: Checkbox state after the call
+            
+        Raises:
+            TimeoutException: If remember me checkbox is not found
+        """
+        checked = self.driver.execute_script(
+            "const cb = document.querySelector(arguments[0]);"
+            "if (!cb) return null;"
+            "if (arguments[1] !== null && cb.checked !== arguments[1]) cb.click();"
+            "return cb.checked;",
+            self._to_query(self.REMEMBER_ME_CHECKBOX)[1],
+            desired_state
+        )
+        if checked is not None:
+            return checked
+        
+        # Not rendered yet: wait for it the regular way
         checkbox = self.find_element(self.REMEMBER_ME_CHECKBOX)
-        if checkbox.is_selected():
+        if desired_state is not None and checkbox.is_selected() != desired_state:
             self.click_element(self.REMEMBER_ME_CHECKBOX)
+        return checkbox.is_selected()
     
     def is_remember_me_checked(self) -> bool:
         """
@@ -144,8 +165,7 @@ class LoginPage(BasePage):
         Raises:
             TimeoutException: If remember me checkbox is not found
         """
-        checkbox = self.find_element(self.REMEMBER_ME_CHECKBOX)
-        return checkbox.is_selected()
+        return self._set_remember_me(None)
     
     def login(self, username: str, password: str, remember_me: bool = False) -> None:
         """
@@ -161,13 +181,9 @@ class LoginPage(BasePage):
         """
         self.logger.info(f"Performing login for user: {username}")
         
-        # Clear any existing values first
-        self.clear_username_field()
-        self.clear_password_field()
-        
-        # Enter credentials
-        self.enter_username(username)
-        self.enter_password(password)
+        # Enter credentials, replacing any existing values
+        self.js_set_value(self.USERNAME_FIELD, username)
+        self.js_set_value(self.PASSWORD_FIELD, password)
         
         # Handle remember me option
         if remember_me:
@@ -187,8 +203,7 @@ class LoginPage(BasePage):
             bool: True if error message is visible, False otherwise
         """
         try:
-            return self.is_element_displayed(self.ERROR_MESSAGE) or \
-                   self.is_element_displayed(self.ERROR_MESSAGE_ALT)
+            return self.is_element_displayed(self.ERROR_MESSAGE_ANY)
         except Exception:
             return False
     
@@ -200,14 +215,10 @@ class LoginPage(BasePage):
             str: Error message text or empty string if no error
         """
         try:
-            if self.is_element_displayed(self.ERROR_MESSAGE):
-                return self.get_element_text(self.ERROR_MESSAGE)
-            elif self.is_element_displayed(self.ERROR_MESSAGE_ALT):
-                return self.get_element_text(self.ERROR_MESSAGE_ALT)
+            return self._first_displayed_text(self.ERROR_MESSAGE_ANY)
         except Exception as e:
             self.logger.warning(f"Could not get error message text: {e}")
-        return ""
-        return ""
+            return ""
     
     def click_forgot_password_link(self) -> None:
         """
@@ -262,8 +273,7 @@ class LoginPage(BasePage):
         Raises:
             TimeoutException: If username field is not found
         """
-        element = self.find_element(self.USERNAME_FIELD)
-        return element.get_attribute('value') or ""
+        return self.get_value(self.USERNAME_FIELD)
     
     def get_password_field_value(self) -> str:
         """
@@ -275,8 +285,7 @@ class LoginPage(BasePage):
         Raises:
             TimeoutException: If password field is not found
         """
-        element = self.find_element(self.PASSWORD_FIELD)
-        return element.get_attribute('value') or ""
+        return self.get_value(self.PASSWORD_FIELD)
     
     def is_username_field_displayed(self) -> bool:
         """
@@ -310,8 +319,7 @@ class LoginPage(BasePage):
             bool: True if login button is displayed, False otherwise
         """
         try:
-            return self.is_element_displayed(self.LOGIN_BUTTON) or \
-                   self.is_element_displayed(self.LOGIN_BUTTON_ALT)
+            return self.is_element_displayed(self.LOGIN_BUTTON_ANY)
         except Exception:
             return False
     
@@ -326,9 +334,14 @@ class LoginPage(BasePage):
             TimeoutException: If page doesn't load within timeout
         """
         self.logger.info(f"Waiting for login page to load (timeout: {timeout}s)")
-        self.wait_for_element_to_be_visible(self.USERNAME_FIELD, timeout)
-        self.wait_for_element_to_be_visible(self.PASSWORD_FIELD, timeout)
-        self.wait_for_element_to_be_clickable(self.LOGIN_BUTTON, timeout)
+        # One wait covering all three elements, each poll a single in-browser probe
+        WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
+            lambda driver: all(self._bulk_visible({
+                'username': self.USERNAME_FIELD,
+                'password': self.PASSWORD_FIELD,
+                'login': self.LOGIN_BUTTON,
+            }).values())
+        )
         self.logger.info("Login page loaded successfully with all elements")
     
     def verify_login_page_elements(self) -> bool:
@@ -339,10 +352,16 @@ class LoginPage(BasePage):
             bool: True if all essential elements are present, False otherwise
         """
         try:
+            # One in-browser probe instead of a find/isDisplayed pair per element
+            visible = self._bulk_visible({
+                'username': self.USERNAME_FIELD,
+                'password': self.PASSWORD_FIELD,
+                'login': self.LOGIN_BUTTON_ANY,
+            })
             elements_present = (
-                self.is_username_field_displayed() and
-                self.is_password_field_displayed() and
-                self.is_login_button_displayed()
+                visible['username'] and
+                visible['password'] and
+                visible['login']
             )
             
             if elements_present:
@@ -368,8 +387,8 @@ class LoginPage(BasePage):
             TimeoutException: If any login elements are not found
         """
         self.logger.info(f"Performing quick login for user: {username}")
-        self.enter_username(username)
-        self.enter_password(password)
+        self.js_set_value(self.USERNAME_FIELD, username)
+        self.js_set_value(self.PASSWORD_FIELD, password)
         self.click_login_button()
 
     def get_page_title(self) -> str:
@@ -389,11 +408,24 @@ class LoginPage(BasePage):
             bool: True if on login page, False otherwise
         """
         try:
-            current_url = self.driver.current_url
+            # Repeat checks against an unchanged page reuse an earlier positive answer;
+            # negatives are not cached, since the same page can still finish rendering
+            fingerprint = self._page_fingerprint()
+            if fingerprint in self._verify_cache:
+                return True
+            
+            # The fingerprint read above already fetched the URL
+            current_url = self._cached_url
             is_login_url = "login" in current_url.lower()
-            has_login_elements = self.verify_login_page_elements()
             
-            return is_login_url and has_login_elements
+            # The element check costs several WebDriver calls, so skip it on a URL mismatch
+            if not is_login_url:
+                return False
+            
+            if not self.verify_login_page_elements():
+                return False
+            self._verify_cache.add(fingerprint)
+            return True
         except Exception as e:
             self.logger.error(f"Error checking if on login page: {e}")
             return False
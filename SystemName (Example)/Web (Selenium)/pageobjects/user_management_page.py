@@ -5,17 +5,76 @@ This module contains the UserManagementPage class which provides methods to inte
 with user management functionality following the Page Object Model pattern.
 """
 
-import sys
-import os
-from typing import Optional
-
-# Add the base directory to Python path for importing base classes
-base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'base')
-sys.path.append(base_dir)
+from functools import lru_cache
+from typing import Dict, List, Optional
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from web_selenium.base_page import BasePage
+from selenium.webdriver.support.ui import WebDriverWait
+from base.web_selenium.base_page import BasePage, _xpath_literal
+
+
+# XPath templates for locators parameterised by a quoted literal
+_BUTTON_XPATH_TEMPLATE = "//button[text()=%s]"
+_CELL_XPATH_TEMPLATE = "//td[text()=%s]"
+_EDIT_BUTTON_XPATH_TEMPLATE = "//tr[td[text()=%s]]//button[contains(@class, 'edit') or contains(text(), 'Edit')]"
+_DELETE_BUTTON_XPATH_TEMPLATE = "//tr[td[text()=%s]]//button[contains(@class, 'delete') or contains(text(), 'Delete')]"
+
+
+# Locators that depend only on their text argument are built once per text
+@lru_cache(maxsize=512)
+def _button_xpath(button_text: str) -> tuple:
+    return (By.XPATH, _BUTTON_XPATH_TEMPLATE % _xpath_literal(button_text))
+
+
+@lru_cache(maxsize=512)
+def _cell_xpath(cell_text: str) -> tuple:
+    return (By.XPATH, _CELL_XPATH_TEMPLATE % _xpath_literal(cell_text))
+
+
+@lru_cache(maxsize=512)
+def _edit_button_xpath(username: str) -> tuple:
+    return (By.XPATH, _EDIT_BUTTON_XPATH_TEMPLATE % _xpath_literal(username))
+
+
+@lru_cache(maxsize=256)
+def _delete_button_xpath(username: str) -> tuple:
+    return (By.XPATH, _DELETE_BUTTON_XPATH_TEMPLATE % _xpath_literal(username))
+
+
+@lru_cache(maxsize=128)
+def _field_locator(field_name: str) -> tuple:
+    return (By.NAME, field_name.lower().replace(' ', '_'))
+
+
+# Finds the delete button in the row whose cell text equals arguments[0], matching
+# rows with native DOM calls instead of an XPath text() predicate
+_FIND_DELETE_BUTTON_SCRIPT = """
+const row = Array.from(document.querySelectorAll('tr')).find(
+    tr => Array.from(tr.cells).some(td => td.textContent.trim() === arguments[0])
+);
+if (!row) return null;
+return row.querySelector("button.delete, button[class*='delete'], button[data-action='delete']")
+    || Array.from(row.querySelectorAll('button')).find(b => b.textContent.includes('Delete'))
+    || null;
+"""
+
+# Settles what a Delete click on the row of user arguments[0] led to: the rendered
+# confirmation button of a dialog, true once the row is gone without one, else null
+_DELETE_OUTCOME_SCRIPT = """
+const confirm = Array.from(document.querySelectorAll('button')).find(
+    b => /Confirm|Yes/.test(b.textContent) && b.getClientRects().length > 0
+);
+if (confirm) return confirm;
+const rowGone = !Array.from(document.querySelectorAll('tr')).some(
+    tr => Array.from(tr.cells).some(td => td.textContent.trim() === arguments[0])
+);
+return rowGone || null;
+"""
+
+# Upper bound in seconds on waiting for the Delete click to settle
+_DELETE_OUTCOME_TIMEOUT = 2
 
 
 class UserManagementPage(BasePage):
@@ -56,7 +115,7 @@ class UserManagementPage(BasePage):
     CONFIRM_PASSWORD_FIELD = (By.NAME, "confirm_password")
     
     # Alternative locators
-    SUCCESS_MESSAGE_ALT = (By.CSS_SELECTOR, ".alert-success, .notification-success")
+    SUCCESS_MESSAGE_ANY = (By.CSS_SELECTOR, ".success-message, .alert-success, .notification-success")
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".alert-danger, .error-message")
     LOADING_INDICATOR = (By.CLASS_NAME, "loading")
     
@@ -117,8 +176,7 @@ class UserManagementPage(BasePage):
             TimeoutException: If button with specified text is not found
         """
         self.logger.info(f"Clicking button with text: {button_text}")
-        button_locator = (By.XPATH, f"//button[text()='{button_text}']")
-        self.click_element(button_locator)
+        self.click_element(_button_xpath(button_text))
     
     def fill_field(self, field_name: str, value: str) -> None:
         """
@@ -132,8 +190,7 @@ class UserManagementPage(BasePage):
             TimeoutException: If field is not found
         """
         self.logger.info(f"Filling field '{field_name}' with value: {value}")
-        field_locator = (By.NAME, field_name.lower().replace(' ', '_'))
-        self.clear_and_type(field_locator, value)
+        self.js_set_value(_field_locator(field_name), value)
     
     def is_success_message_displayed(self) -> bool:
         """
@@ -142,11 +199,7 @@ class UserManagementPage(BasePage):
         Returns:
             bool: True if success message is visible, False otherwise
         """
-        try:
-            return self.is_element_displayed(self.SUCCESS_MESSAGE) or \
-                   self.is_element_displayed(self.SUCCESS_MESSAGE_ALT)
-        except Exception:
-            return False
+        return self.is_element_displayed(self.SUCCESS_MESSAGE_ANY)
     
     def get_success_message_text(self) -> str:
         """
@@ -156,10 +209,7 @@ class UserManagementPage(BasePage):
             str: Success message text or empty string if not found
         """
         try:
-            if self.is_element_displayed(self.SUCCESS_MESSAGE):
-                return self.get_element_text(self.SUCCESS_MESSAGE)
-            elif self.is_element_displayed(self.SUCCESS_MESSAGE_ALT):
-                return self.get_element_text(self.SUCCESS_MESSAGE_ALT)
+            return self._first_displayed_text(self.SUCCESS_MESSAGE_ANY)
         except Exception as e:
             self.logger.warning(f"Could not get success message text: {e}")
         return ""
@@ -171,10 +221,7 @@ class UserManagementPage(BasePage):
         Returns:
             bool: True if error message is visible, False otherwise
         """
-        try:
-            return self.is_element_displayed(self.ERROR_MESSAGE)
-        except Exception:
-            return False
+        return self.is_element_displayed(self.ERROR_MESSAGE)
     
     def get_error_message_text(self) -> str:
         """
@@ -184,8 +231,7 @@ class UserManagementPage(BasePage):
             str: Error message text or empty string if not found
         """
         try:
-            if self.is_element_displayed(self.ERROR_MESSAGE):
-                return self.get_element_text(self.ERROR_MESSAGE)
+            return self._first_displayed_text(self.ERROR_MESSAGE)
         except Exception as e:
             self.logger.warning(f"Could not get error message text: {e}")
         return ""
@@ -201,11 +247,38 @@ class UserManagementPage(BasePage):
             bool: True if user is found in list, False otherwise
         """
         self.logger.info(f"Checking if user '{username}' is in list")
-        user_locator = (By.XPATH, f"//td[text()='{username}']")
+        return self.is_element_displayed(_cell_xpath(username))
+    
+    def are_users_in_list(self, usernames: List[str]) -> Dict[str, bool]:
+        """
+        Check which of several users appear in the user list, in a single browser call.
+        
+        Args:
+            usernames (List[str]): Usernames to search for
+            
+        Returns:
+            Dict[str, bool]: Presence in the list keyed by username
+        """
+        self.logger.info(f"Checking if users {usernames} are in list")
+        cell_selector = f"{self._to_query(self.USER_TABLE)[1]} td"
         try:
-            return self.is_element_displayed(user_locator)
-        except Exception:
-            return False
+            return self.driver.execute_script(
+                """
+                const wanted = new Set(arguments[1]);
+                const found = {};
+                document.querySelectorAll(arguments[0]).forEach(td => {
+                    const text = td.textContent.trim();
+                    if (wanted.has(text)) found[text] = true;
+                });
+                arguments[1].forEach(name => found[name] = !!found[name]);
+                return found;
+                """,
+                cell_selector,
+                list(usernames)
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not check users in list: {e}")
+            return {username: False for username in usernames}
     
     def search_user(self, username: str) -> None:
         """
@@ -218,7 +291,7 @@ class UserManagementPage(BasePage):
             TimeoutException: If search field is not found
         """
         self.logger.info(f"Searching for user: {username}")
-        self.clear_and_type(self.SEARCH_FIELD, username)
+        self.js_set_value(self.SEARCH_FIELD, username)
     
     def click_edit_user(self, username: str) -> None:
         """
@@ -231,8 +304,7 @@ class UserManagementPage(BasePage):
             TimeoutException: If edit button for user is not found
         """
         self.logger.info(f"Clicking edit button for user: {username}")
-        edit_button_locator = (By.XPATH, f"//tr[td[text()='{username}']]//button[contains(@class, 'edit') or contains(text(), 'Edit')]")
-        self.click_element(edit_button_locator)
+        self.click_element(_edit_button_xpath(username))
     
     def update_user_email(self, new_email: str) -> None:
         """
@@ -277,11 +349,7 @@ class UserManagementPage(BasePage):
             bool: True if email is found in list, False otherwise
         """
         self.logger.info(f"Checking if email '{email}' is updated in list")
-        email_locator = (By.XPATH, f"//td[text()='{email}']")
-        try:
-            return self.is_element_displayed(email_locator)
-        except Exception:
-            return False
+        return self.element_exists(_cell_xpath(email))
     
     def delete_user(self, username: str) -> None:
         """
@@ -294,17 +362,25 @@ class UserManagementPage(BasePage):
             TimeoutException: If delete button for user is not found
         """
         self.logger.info(f"Deleting user: {username}")
-        delete_button_locator = (By.XPATH, f"//tr[td[text()='{username}']]//button[contains(@class, 'delete') or contains(text(), 'Delete')]")
-        self.click_element(delete_button_locator)
+        delete_button = self.driver.execute_script(_FIND_DELETE_BUTTON_SCRIPT, username)
+        if delete_button is not None:
+            delete_button.click()
+        else:
+            # Table not rendered yet: wait for the row the regular way
+            self.click_element(_delete_button_xpath(username))
         
-        # Handle confirmation dialog if present
+        # Handle confirmation dialog if present; it may render shortly after the click,
+        # so poll until it shows up or the row is removed without one
         try:
-            confirm_button = (By.XPATH, "//button[contains(text(), 'Confirm') or contains(text(), 'Yes')]")
-            if self.is_element_displayed(confirm_button):
-                self.click_element(confirm_button)
-                self.logger.info("Confirmed user deletion")
-        except Exception:
-            pass  # No confirmation dialog present
+            outcome = WebDriverWait(
+                self.driver, _DELETE_OUTCOME_TIMEOUT, poll_frequency=self.poll_frequency
+            ).until(lambda d: d.execute_script(_DELETE_OUTCOME_SCRIPT, username))
+        except TimeoutException:
+            return  # No confirmation dialog present
+        if outcome is True:
+            return  # Deleted without a confirmation dialog
+        outcome.click()
+        self.logger.info("Confirmed user deletion")
     
     def create_user(self, username: str, email: str, first_name: str = "", last_name: str = "", 
                    role: str = "user", password: str = "defaultPassword123") -> None:
@@ -329,37 +405,26 @@ class UserManagementPage(BasePage):
         # Wait for form to be visible
         self.wait_for_element_visible(self.USER_FORM)
         
-        # Fill required fields
-        self.clear_and_type(self.USERNAME_FIELD, username)
-        self.clear_and_type(self.EMAIL_FIELD, email)
-        
-        # Fill password fields if present
-        try:
-            if self.is_element_displayed(self.PASSWORD_FIELD):
-                self.clear_and_type(self.PASSWORD_FIELD, password)
-            if self.is_element_displayed(self.CONFIRM_PASSWORD_FIELD):
-                self.clear_and_type(self.CONFIRM_PASSWORD_FIELD, password)
-        except Exception:
-            pass  # Password fields may not be required
-        
-        # Fill optional fields if provided
+        # Fill the whole form in one browser call; password, name and role
+        # fields may not exist and are skipped when missing
+        field_values = {
+            self.USERNAME_FIELD: username,
+            self.EMAIL_FIELD: email,
+            self.PASSWORD_FIELD: password,
+            self.CONFIRM_PASSWORD_FIELD: password,
+        }
         if first_name:
-            try:
-                self.clear_and_type(self.FIRST_NAME_FIELD, first_name)
-            except Exception:
-                pass  # Field may not exist
-        
+            field_values[self.FIRST_NAME_FIELD] = first_name
         if last_name:
-            try:
-                self.clear_and_type(self.LAST_NAME_FIELD, last_name)
-            except Exception:
-                pass  # Field may not exist
-        
+            field_values[self.LAST_NAME_FIELD] = last_name
         if role:
-            try:
-                self.select_from_dropdown(self.ROLE_DROPDOWN, role)
-            except Exception:
-                pass  # Dropdown may not exist
+            field_values[self.ROLE_DROPDOWN] = role
+        filled = self.fill_form(field_values)
+        
+        # Required fields must be filled; wait for any that were not rendered yet
+        for required_locator, value in ((self.USERNAME_FIELD, username), (self.EMAIL_FIELD, email)):
+            if not filled[required_locator]:
+                self.js_set_value(required_locator, value)
         
         # Save the user
         self.click_element(self.SAVE_BUTTON)
@@ -373,8 +438,8 @@ class UserManagementPage(BasePage):
             int: Number of users in the list
         """
         try:
-            user_rows = self.find_elements(self.USER_ROWS)
-            count = len(user_rows)
+            # Counted in the browser, without marshalling a WebElement per row
+            count = self.query_dom_state({'rows': self.USER_ROWS})['rows']
             self.logger.info(f"Found {count} users in the list")
             return count
         except Exception as e:
@@ -402,10 +467,11 @@ class UserManagementPage(BasePage):
             bool: True if all essential elements are present, False otherwise
         """
         try:
-            elements_present = (
-                self.is_element_displayed(self.ADD_USER_BUTTON) and
-                self.is_element_displayed(self.USER_LIST)
-            )
+            visible = self._bulk_visible({
+                'add_user': self.ADD_USER_BUTTON,
+                'user_list': self.USER_LIST,
+            })
+            elements_present = visible['add_user'] and visible['user_list']
             
             if elements_present:
                 self.logger.info("All essential user management page elements are present")
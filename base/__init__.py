@@ -11,21 +11,31 @@ This package contains base classes and utilities for different automation types:
 - utilities: Common utility functions for data processing and file operations
 """
 
-# Import all base modules
-from . import api
-from . import database
-from . import desktop
-from . import mobile
-from . import web_selenium
-from . import web_playwright
-from . import utilities
-
-__all__ = [
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that e.g. an
+# API-only run does not pull in Selenium, Playwright, Appium or database drivers
+_SUBMODULES = (
     'api',
-    'database', 
+    'database',
     'desktop',
     'mobile',
     'web_selenium',
     'web_playwright',
     'utilities'
-]
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
+
+
+__all__ = list(_SUBMODULES)
@@ -4,11 +4,15 @@ API package for the automation framework
 This package contains API testing base classes and utilities.
 """
 
-from .api_client import BaseAPIClient, APIResponseValidator, APITestHelpers
+from .base_api_client import BaseAPIClient
+from .async_api_client import AsyncBaseAPIClient
+from .api_response_validator import APIResponseValidator
+from .api_test_helpers import APITestHelpers
 from .base_api_page import BaseAPIPage
 
 __all__ = [
     'BaseAPIClient',
+    'AsyncBaseAPIClient',
     'APIResponseValidator', 
     'APITestHelpers',
     'BaseAPIPage'
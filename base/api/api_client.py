@@ -1,13 +0,0 @@
-"""API client and related utilities - backward compatibility imports"""
-
-# Import individual API classes
-from .base_api_client import BaseAPIClient
-from .api_response_validator import APIResponseValidator
-from .api_test_helpers import APITestHelpers
-
-# Re-export all classes for backward compatibility
-__all__ = [
-    'BaseAPIClient',
-    'APIResponseValidator',
-    'APITestHelpers'
-]
@@ -1,7 +1,78 @@
 """API response validator for automation testing"""
 
+import json
 import requests
-from typing import Dict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Tuple
+
+try:
+    # Optional, considerably faster parser for large bodies
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+_SENTINEL = object()
+
+
+def _cached_json(response: requests.Response):
+    """Parse the response body once and reuse it across validators.
+
+    The returned object is shared between validators and must not be mutated.
+    """
+    json_data = getattr(response, '_cached_json', _SENTINEL)
+    if json_data is _SENTINEL:
+        json_data = _json_loads(response.content)
+        response._cached_json = json_data
+    return json_data
+
+
+@lru_cache(maxsize=256)
+def _as_frozenset(values: Tuple[Hashable, ...]) -> FrozenSet:
+    """Build the lookup set for a validator call site once"""
+    return frozenset(values)
+
+
+# Validators keyed by id() of the schema they were built from. Each entry keeps its
+# schema alive, so the id cannot be taken by another object while it is cached
+_VALIDATORS: Dict[int, Tuple[Dict, Any]] = {}
+_VALIDATORS_MAX = 128
+
+
+def _validator_for(schema: Dict):
+    """Build and check a validator once per schema object"""
+    entry = _VALIDATORS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    import jsonschema
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema)
+    if len(_VALIDATORS) >= _VALIDATORS_MAX:
+        # Drop the oldest entry; schemas are usually module-level constants, so few are ever evicted
+        _VALIDATORS.pop(next(iter(_VALIDATORS)), None)
+    _VALIDATORS[id(schema)] = (schema, validator)
+    return validator
+
+
+@lru_cache(maxsize=64)
+def _normalized_media_type(expected_type: str) -> str:
+    """Lower-case an expected content type once per call site"""
+    return expected_type.strip().lower()
+
+
+@lru_cache(maxsize=32)
+def _as_timedelta(seconds: float) -> timedelta:
+    """Convert a response time limit once per distinct value"""
+    return timedelta(seconds=seconds)
+
+
+@lru_cache(maxsize=64)
+def _header_key(header_name: str) -> str:
+    """Lower-case a header name once; CaseInsensitiveDict matches on the lowered key"""
+    return header_name.lower()
 
 
 class APIResponseValidator:
@@ -13,32 +84,44 @@ class APIResponseValidator:
         return response.status_code == expected_code
     
     @staticmethod
-    def validate_status_codes(response: requests.Response, expected_codes: list) -> bool:
+    def validate_status_codes(response: requests.Response, expected_codes: Iterable[int]) -> bool:
         """Validate response status code is in list of expected codes"""
+        if not isinstance(expected_codes, frozenset):
+            expected_codes = _as_frozenset(tuple(expected_codes))
         return response.status_code in expected_codes
     
     @staticmethod
     def validate_content_type(response: requests.Response, expected_type: str) -> bool:
         """Validate response content type"""
         content_type = response.headers.get('content-type', '')
-        return expected_type in content_type
+        expected = _normalized_media_type(expected_type)
+        if '/' not in expected or ';' in expected:
+            # Partial ("json") or parameterised expectations keep substring semantics
+            return expected in content_type.lower()
+        semi = content_type.find(';')
+        media_type = content_type if semi < 0 else content_type[:semi]
+        return media_type.strip().lower() == expected
     
     @staticmethod
-    def validate_json_structure(response: requests.Response, required_keys: list) -> bool:
+    def validate_json_structure(response: requests.Response, required_keys: Iterable[str]) -> bool:
         """Validate JSON response has required keys"""
         try:
-            json_data = response.json()
-            return all(key in json_data for key in required_keys)
+            json_data = _cached_json(response)
+            if not isinstance(json_data, dict):
+                return False
+            if not isinstance(required_keys, frozenset):
+                required_keys = _as_frozenset(tuple(required_keys))
+            return required_keys <= json_data.keys()
         except (ValueError, TypeError):
             return False
     
     @staticmethod
     def validate_json_schema(response: requests.Response, schema: Dict) -> bool:
         """Validate JSON response against schema"""
+        import jsonschema
         try:
-            import jsonschema
-            json_data = response.json()
-            jsonschema.validate(json_data, schema)
+            json_data = _cached_json(response)
+            _validator_for(schema).validate(json_data)
             return True
         except (ValueError, TypeError, jsonschema.ValidationError):
             return False
@@ -46,14 +129,14 @@ class APIResponseValidator:
     @staticmethod
     def validate_response_time(response: requests.Response, max_time: float) -> bool:
         """Validate response time is within limit"""
-        return response.elapsed.total_seconds() <= max_time
+        return response.elapsed <= _as_timedelta(max_time)
     
     @staticmethod
     def validate_header_present(response: requests.Response, header_name: str) -> bool:
         """Validate specific header is present"""
-        return header_name in response.headers
+        return _header_key(header_name) in response.headers
     
     @staticmethod
     def validate_header_value(response: requests.Response, header_name: str, expected_value: str) -> bool:
         """Validate header has expected value"""
-        return response.headers.get(header_name) == expected_value
+        return response.headers.get(_header_key(header_name)) == expected_value
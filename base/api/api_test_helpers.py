@@ -1,9 +1,173 @@
 """API test helpers for automation testing"""
 
+import asyncio
+import hashlib
+import json
+import random
 import requests
+import string
+import threading
 import time
-from typing import Dict, Any
+from collections import OrderedDict
+from datetime import datetime
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from .base_api_client import BaseAPIClient
+from .async_api_client import AsyncBaseAPIClient
+from .api_response_validator import _cached_json
+from ..utilities.error_handler import ApiError, ConnectionError, TimeoutError
+
+
+# Comparison results keyed by the digests of both raw bodies, least recently used first
+_COMPARE_CACHE: 'OrderedDict[Tuple[bytes, bytes], Dict[str, Any]]' = OrderedDict()
+_COMPARE_CACHE_MAX = 256
+_compare_cache_lock = threading.Lock()
+
+
+def _body_digest(response: requests.Response) -> bytes:
+    """Digest of the raw response body, cheap next to parsing and diffing it"""
+    return hashlib.sha1(response.content, usedforsecurity=False).digest()
+
+
+@lru_cache(maxsize=512)
+def _compile_json_path(json_path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Split a dot-notation path once into (key, list index or None) steps"""
+    return tuple((key, int(key) if key.isdigit() else None) for key in json_path.split('.'))
+
+
+# Bound once so each generated record skips the module attribute lookups
+_choice = random.choice
+_choices = random.choices
+_randint = random.randint
+_uniform = random.uniform
+_ascii_lowercase = string.ascii_lowercase
+
+_TEST_DATA_GENERATORS = {
+    'user': lambda: {
+        'username': ''.join(_choices(_ascii_lowercase, k=8)),
+        'email': f"test_{_randint(1000, 9999)}@example.com",
+        'first_name': 'Test',
+        'last_name': 'User',
+        'age': _randint(18, 80)
+    },
+    'product': lambda: {
+        'name': f"Test Product {_randint(1, 1000)}",
+        'price': round(_uniform(10, 1000), 2),
+        'category': _choice(['electronics', 'clothing', 'books']),
+        'in_stock': _choice([True, False])
+    },
+    'order': lambda: {
+        'order_id': f"ORD-{_randint(10000, 99999)}",
+        'total_amount': round(_uniform(50, 500), 2),
+        'status': _choice(['pending', 'processing', 'shipped', 'delivered']),
+        'order_date': datetime.now().isoformat()
+    }
+}
+
+
+# Node kinds for _find_json_diffs, keyed by exact type
+_DICT = 'dict'
+_LIST = 'list'
+_JSON_CONTAINER_KINDS = {dict: _DICT, list: _LIST}
+
+
+def _json_item_key(item: Any, key_cache: Dict[int, Any]) -> Any:
+    """Hashable canonical form of a JSON value, used to align list items"""
+    if not isinstance(item, (dict, list)):
+        return (type(item), item)
+    # Containers are serialized once per diff, however often their parent lists are aligned
+    key = key_cache.get(id(item))
+    if key is None:
+        key = key_cache[id(item)] = json.dumps(item, sort_keys=True, default=str)
+    return key
+
+
+def _find_json_diffs(obj1: Any, obj2: Any, path: str = '',
+                     _type=type, _isinstance=isinstance,
+                     _kind_of=_JSON_CONTAINER_KINDS.get) -> list:
+    """Find differences between two JSON objects.
+    
+    Hot builtins are bound as default arguments and bound methods as locals, so the
+    walk loop only does fast local lookups.
+    """
+    differences = []
+    add_difference = differences.append
+    # Walk with an explicit stack so deeply nested payloads cannot exhaust the call stack
+    stack = [(obj1, obj2, path)]
+    pop = stack.pop
+    push_all = stack.extend
+    # Canonical forms of containers by id(); every node stays alive for the whole call
+    key_cache = {}
+    
+    while stack:
+        item1, item2, current_path = pop()
+        
+        # The very same object cannot differ from itself
+        if item1 is item2:
+            continue
+        
+        item_type = _type(item1)
+        if item_type is not _type(item2):
+            add_difference(f"{current_path}: type mismatch ({item_type} vs {_type(item2)})")
+            continue
+        
+        # Parsed JSON only holds exact dicts and lists, so an identity lookup settles
+        # the node kind; subclasses passed in by callers fall back to isinstance
+        kind = _kind_of(item_type)
+        if kind is None and _isinstance(item1, (dict, list)):
+            kind = _DICT if _isinstance(item1, dict) else _LIST
+        
+        if kind is _DICT:
+            children = []
+            for key in item1.keys() | item2.keys():
+                new_path = f"{current_path}.{key}" if current_path else key
+                
+                if key not in item1:
+                    add_difference(f"{new_path}: missing in first object")
+                elif key not in item2:
+                    add_difference(f"{new_path}: missing in second object")
+                else:
+                    children.append((item1[key], item2[key], new_path))
+            push_all(reversed(children))
+        
+        elif kind is _LIST:
+            if len(item1) != len(item2):
+                add_difference(f"{current_path}: length mismatch ({len(item1)} vs {len(item2)})")
+            
+            # Align items by content so one insertion does not shift every later item
+            # into a mismatch; only replaced runs are compared item by item
+            children = []
+            matcher = SequenceMatcher(
+                None,
+                [_json_item_key(child, key_cache) for child in item1],
+                [_json_item_key(child, key_cache) for child in item2],
+                autojunk=False
+            )
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == 'equal':
+                    continue
+                paired = min(i2 - i1, j2 - j1) if tag == 'replace' else 0
+                for offset in range(paired):
+                    i = i1 + offset
+                    new_path = f"{current_path}[{i}]" if current_path else f"[{i}]"
+                    children.append((item1[i], item2[j1 + offset], new_path))
+                for i in range(i1 + paired, i2):
+                    new_path = f"{current_path}[{i}]" if current_path else f"[{i}]"
+                    add_difference(f"{new_path}: missing in second object")
+                for j in range(j1 + paired, j2):
+                    new_path = f"{current_path}[{j}]" if current_path else f"[{j}]"
+                    add_difference(f"{new_path}: missing in first object")
+            
+            # Pushed in reverse so items are reported in list order
+            push_all(reversed(children))
+        
+        # Scalars are compared natively only once their types match; containers are
+        # always walked, since == treats 1, True and 1.0 as equal inside them
+        elif item1 != item2:
+            add_difference(f"{current_path}: value mismatch ({item1} vs {item2})")
+    
+    return differences
 
 
 class APITestHelpers:
@@ -14,6 +178,8 @@ class APITestHelpers:
                           timeout: int = 60, poll_interval: int = 5) -> bool:
         """Wait for API to be ready"""
         start_time = time.time()
+        # Exponential backoff with full jitter, capped at poll_interval
+        delay = 0.1
         
         while time.time() - start_time < timeout:
             try:
@@ -23,23 +189,56 @@ class APITestHelpers:
             except requests.RequestException:
                 pass
             
-            time.sleep(poll_interval)
+            time.sleep(random.uniform(0, min(delay, poll_interval)))
+            delay = min(delay * 2, poll_interval)
         
         return False
     
+    @staticmethod
+    async def _wait_for_async_api_ready(client: AsyncBaseAPIClient, endpoint: str,
+                                        timeout: float, poll_interval: float) -> bool:
+        """Poll one async client until it responds, with the same backoff as wait_for_api_ready"""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        delay = 0.1
+        
+        while loop.time() - start_time < timeout:
+            try:
+                await client.get(endpoint)
+                return True
+            except ApiError as e:
+                if e.status_code is not None and e.status_code < 500:  # API is responding
+                    return True
+            except (ConnectionError, TimeoutError):
+                pass
+            
+            await asyncio.sleep(random.uniform(0, min(delay, poll_interval)))
+            delay = min(delay * 2, poll_interval)
+        
+        return False
+    
+    @staticmethod
+    def wait_for_many_apis_ready(targets: List[Tuple[AsyncBaseAPIClient, str]],
+                                 timeout: int = 60, poll_interval: int = 5) -> List[bool]:
+        """Wait for several APIs concurrently, returning readiness per (client, endpoint)"""
+        async def wait_all():
+            return await asyncio.gather(*(
+                APITestHelpers._wait_for_async_api_ready(client, endpoint, timeout, poll_interval)
+                for client, endpoint in targets
+            ))
+        
+        return list(asyncio.run(wait_all()))
+    
     @staticmethod
     def extract_json_value(response: requests.Response, json_path: str) -> Any:
         """Extract value from JSON response using dot notation"""
         try:
-            json_data = response.json()
-            keys = json_path.split('.')
-            
-            value = json_data
-            for key in keys:
+            value = _cached_json(response)
+            for key, index in _compile_json_path(json_path):
                 if isinstance(value, dict):
                     value = value[key]
-                elif isinstance(value, list) and key.isdigit():
-                    value = value[int(key)]
+                elif index is not None and isinstance(value, list):
+                    value = value[index]
                 else:
                     return None
             
@@ -51,85 +250,45 @@ class APITestHelpers:
     def compare_json_responses(response1: requests.Response, 
                              response2: requests.Response) -> Dict[str, Any]:
         """Compare two JSON responses"""
+        # The same pair of bodies (e.g. one expected response against repeated
+        # actual ones) is only parsed and diffed once
+        cache_key = (_body_digest(response1), _body_digest(response2))
+        with _compare_cache_lock:
+            cached = _COMPARE_CACHE.get(cache_key)
+            if cached is not None:
+                _COMPARE_CACHE.move_to_end(cache_key)
+                return {'equal': cached['equal'], 'differences': list(cached['differences'])}
+        
         try:
-            json1 = response1.json()
-            json2 = response2.json()
+            json1 = _cached_json(response1)
+            json2 = _cached_json(response2)
             
-            return {
-                'equal': json1 == json2,
-                'differences': APITestHelpers._find_json_differences(json1, json2)
-            }
+            # Byte-identical bodies need no structural walk; == on the parsed values is
+            # no substitute, since it treats 1, True and 1.0 as equal inside containers
+            if cache_key[0] == cache_key[1]:
+                result = {'equal': True, 'differences': []}
+            else:
+                differences = APITestHelpers._find_json_differences(json1, json2)
+                result = {'equal': not differences, 'differences': differences}
         except ValueError:
             return {'equal': False, 'error': 'Invalid JSON in response(s)'}
+        
+        with _compare_cache_lock:
+            _COMPARE_CACHE[cache_key] = {'equal': result['equal'], 'differences': list(result['differences'])}
+            if len(_COMPARE_CACHE) > _COMPARE_CACHE_MAX:
+                _COMPARE_CACHE.popitem(last=False)
+        return result
     
     @staticmethod
     def _find_json_differences(obj1: Any, obj2: Any, path: str = '') -> list:
         """Find differences between two JSON objects"""
-        differences = []
-        
-        if type(obj1) != type(obj2):
-            differences.append(f"{path}: type mismatch ({type(obj1)} vs {type(obj2)})")
-            return differences
-        
-        if isinstance(obj1, dict):
-            all_keys = set(obj1.keys()) | set(obj2.keys())
-            for key in all_keys:
-                new_path = f"{path}.{key}" if path else key
-                
-                if key not in obj1:
-                    differences.append(f"{new_path}: missing in first object")
-                elif key not in obj2:
-                    differences.append(f"{new_path}: missing in second object")
-                else:
-                    differences.extend(
-                        APITestHelpers._find_json_differences(obj1[key], obj2[key], new_path)
-                    )
-        
-        elif isinstance(obj1, list):
-            if len(obj1) != len(obj2):
-                differences.append(f"{path}: length mismatch ({len(obj1)} vs {len(obj2)})")
-            
-            for i, (item1, item2) in enumerate(zip(obj1, obj2)):
-                new_path = f"{path}[{i}]" if path else f"[{i}]"
-                differences.extend(
-                    APITestHelpers._find_json_differences(item1, item2, new_path)
-                )
-        
-        elif obj1 != obj2:
-            differences.append(f"{path}: value mismatch ({obj1} vs {obj2})")
-        
-        return differences
+        return _find_json_diffs(obj1, obj2, path)
     
     @staticmethod
     def generate_test_data(data_type: str) -> Dict[str, Any]:
         """Generate test data for API requests"""
-        import random
-        import string
-        from datetime import datetime
-        
-        generators = {
-            'user': lambda: {
-                'username': ''.join(random.choices(string.ascii_lowercase, k=8)),
-                'email': f"test_{random.randint(1000, 9999)}@example.com",
-                'first_name': 'Test',
-                'last_name': 'User',
-                'age': random.randint(18, 80)
-            },
-            'product': lambda: {
-                'name': f"Test Product {random.randint(1, 1000)}",
-                'price': round(random.uniform(10, 1000), 2),
-                'category': random.choice(['electronics', 'clothing', 'books']),
-                'in_stock': random.choice([True, False])
-            },
-            'order': lambda: {
-                'order_id': f"ORD-{random.randint(10000, 99999)}",
-                'total_amount': round(random.uniform(50, 500), 2),
-                'status': random.choice(['pending', 'processing', 'shipped', 'delivered']),
-                'order_date': datetime.now().isoformat()
-            }
-        }
-        
-        if data_type not in generators:
+        generator = _TEST_DATA_GENERATORS.get(data_type)
+        if generator is None:
             raise ValueError(f"Unsupported data type: {data_type}")
         
-        return generators[data_type]()
+        return generator()
@@ -0,0 +1,131 @@
+"""Asynchronous API client for automation testing"""
+
+import logging
+from typing import Dict, Optional, Union
+
+try:
+    import httpx
+except ImportError:
+    # httpx is optional; only the async client needs it
+    httpx = None
+
+from .base_api_client import BaseAPIClient
+from ..utilities.error_handler import ApiError, ConnectionError, TimeoutError, ErrorCategory
+
+
+class AsyncBaseAPIClient:
+    """Asynchronous counterpart of BaseAPIClient built on httpx.AsyncClient.
+    
+    Mirrors the request surface of the sync client, but each method is a
+    coroutine so independent requests can overlap their network latency.
+    """
+    
+    _DEFAULT_HEADERS = BaseAPIClient._DEFAULT_HEADERS
+    
+    # Status code categorization only looks at response.status_code
+    _categorize_http_error = BaseAPIClient._categorize_http_error
+    
+    def __init__(self, base_url: str = "", timeout: int = 30, max_connections: int = 100):
+        if httpx is None:
+            raise ImportError("Please install httpx: pip install httpx")
+        
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # One client, and so one connection pool, for all requests of this instance
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=dict(self._DEFAULT_HEADERS),
+            limits=httpx.Limits(max_connections=max_connections)
+        )
+    
+    async def __aenter__(self) -> 'AsyncBaseAPIClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    def set_auth_token(self, token: str, auth_type: str = 'Bearer'):
+        """Set authentication token"""
+        self.client.headers['Authorization'] = f'{auth_type} {token}'
+        self.logger.info(f"Authentication token set: {auth_type}")
+    
+    def set_api_key(self, api_key: str, header_name: str = 'X-API-Key'):
+        """Set API key header"""
+        self.client.headers[header_name] = api_key
+        self.logger.info(f"API key set in header: {header_name}")
+    
+    def add_header(self, key: str, value: str):
+        """Add custom header"""
+        self.client.headers[key] = value
+        self.logger.info(f"Header added: {key}")
+    
+    def remove_header(self, key: str):
+        """Remove header"""
+        self.client.headers.pop(key, None)
+        self.logger.info(f"Header removed: {key}")
+    
+    async def request(self, method: str, endpoint: str, **kwargs) -> 'httpx.Response':
+        """Send a request, raising the same errors as the sync client"""
+        self.logger.info(f"API Request: {method} {endpoint}")
+        
+        try:
+            response = await self.client.request(method, endpoint, **kwargs)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(
+                f"Request timed out after {self.timeout} seconds",
+                timeout_duration=self.timeout,
+                original_error=e
+            )
+        except httpx.ConnectError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}", host=self.base_url, original_error=e)
+        except httpx.HTTPError as e:
+            raise ApiError(f"Request failed: {str(e)}", category=ErrorCategory.TRANSIENT, original_error=e)
+        
+        self.logger.info(f"API Response: {response.status_code} {response.reason_phrase}")
+        if not response.is_success:
+            raise ApiError(
+                f"HTTP {response.status_code}: {response.reason_phrase}",
+                status_code=response.status_code,
+                response_body=response.text[:500] if response.text else None,
+                category=self._categorize_http_error(response)
+            )
+        return response
+    
+    async def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> 'httpx.Response':
+        """Send GET request"""
+        return await self.request('GET', endpoint, params=params, **kwargs)
+    
+    async def post(self, endpoint: str, json_data: Optional[Dict] = None,
+                   data: Optional[Union[Dict, str]] = None, **kwargs) -> 'httpx.Response':
+        """Send POST request"""
+        return await self.request('POST', endpoint, json=json_data, data=data, **kwargs)
+    
+    async def put(self, endpoint: str, json_data: Optional[Dict] = None,
+                  data: Optional[Union[Dict, str]] = None, **kwargs) -> 'httpx.Response':
+        """Send PUT request"""
+        return await self.request('PUT', endpoint, json=json_data, data=data, **kwargs)
+    
+    async def patch(self, endpoint: str, json_data: Optional[Dict] = None,
+                    data: Optional[Union[Dict, str]] = None, **kwargs) -> 'httpx.Response':
+        """Send PATCH request"""
+        return await self.request('PATCH', endpoint, json=json_data, data=data, **kwargs)
+    
+    async def delete(self, endpoint: str, **kwargs) -> 'httpx.Response':
+        """Send DELETE request"""
+        return await self.request('DELETE', endpoint, **kwargs)
+    
+    async def head(self, endpoint: str, **kwargs) -> 'httpx.Response':
+        """Send HEAD request"""
+        return await self.request('HEAD', endpoint, **kwargs)
+    
+    async def options(self, endpoint: str, **kwargs) -> 'httpx.Response':
+        """Send OPTIONS request"""
+        return await self.request('OPTIONS', endpoint, **kwargs)
+    
+    async def close(self):
+        """Close the client and its connections"""
+        await self.client.aclose()
+        self.logger.info("Async API client closed")
@@ -1,17 +1,34 @@
 """Base API client for automation testing"""
 
+import os
 import requests
 import logging
 import time
 import random
+import shutil
 import threading
+import weakref
+import inspect
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Union, List
 from urllib.parse import urljoin
 from queue import Queue, Empty
 from contextlib import contextmanager
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from urllib3.poolmanager import PoolManager
+from .api_response_validator import _cached_json
+
+try:
+    # Optional, considerably faster encoder for large request bodies
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional; streams multipart uploads instead of building the body in memory
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 from ..utilities.circuit_breaker import (
     CircuitBreaker, CircuitBreakerConfig, create_circuit_breaker,
     CircuitBreakerError, CircuitBreakerState
@@ -30,17 +47,49 @@ class ConnectionPoolAdapter(HTTPAdapter):
     """Custom HTTP adapter with connection pooling configuration."""
     
     def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20, 
-                 max_retries: int = 3, pool_block: bool = False, **kwargs):
+                 max_retries: Union[int, Retry] = 3, pool_block: bool = False, **kwargs):
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
         self.pool_block = pool_block
-        super().__init__(max_retries=max_retries, **kwargs)
-    
-    def init_poolmanager(self, *args, **kwargs):
-        """Initialize pool manager with custom settings."""
-        kwargs['maxsize'] = self.pool_maxsize
-        kwargs['block'] = self.pool_block
-        return super().init_poolmanager(*args, **kwargs)
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                         max_retries=max_retries, pool_block=pool_block, **kwargs)
+
+
+# Transport-level retries for failed connection attempts with exponential backoff
+# (0.2s, 0.4s, ...). HTTP errors and timeouts are already retried by
+# _make_request_with_retry, so statuses and reads are not retried here as well
+_CONNECT_RETRY = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2,
+                       raise_on_status=False)
+
+
+# Block size used when streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of endpoints whose full URL each client remembers
+_URL_CACHE_SIZE = 1024
+
+
+# Adapters (and so their connection pools) shared by every client with the same pool
+# settings, so clients created per scenario reuse already-open TCP/TLS connections
+_shared_adapters: Dict[tuple, ConnectionPoolAdapter] = {}
+_warmed_up_urls = set()
+_shared_pool_lock = threading.Lock()
+
+
+def _get_shared_adapter(pool_connections: int, pool_maxsize: int, 
+                        pool_block: bool) -> ConnectionPoolAdapter:
+    """Get the process-wide adapter for the given pool settings, creating it once."""
+    key = (pool_connections, pool_maxsize, pool_block)
+    with _shared_pool_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            adapter = _shared_adapters[key] = ConnectionPoolAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=_CONNECT_RETRY
+            )
+        return adapter
 
 
 class ConnectionPoolStats:
@@ -157,25 +206,41 @@ class APIHealthChecker(HealthChecker):
 class BaseAPIClient:
     """Enhanced Base API client with circuit breaker, retry logic, and health monitoring"""
     
+    # Headers every client starts with; copied into each session, never mutated
+    _DEFAULT_HEADERS = MappingProxyType({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    })
+    
+    # Clients handed out by get_pooled(), kept only while something still uses them
+    _pooled_clients = weakref.WeakValueDictionary()
+    _pooled_clients_lock = threading.Lock()
+    
     def __init__(self, base_url: str = "", timeout: int = 30, 
                  enable_circuit_breaker: bool = True,
                  circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
                  rate_limit_per_second: float = 10.0,
                  enable_health_monitoring: bool = True,
-                 pool_connections: int = 10,
-                 pool_maxsize: int = 20,
+                 pool_connections: int = 32,
+                 pool_maxsize: int = 32,
                  pool_block: bool = False,
                  enable_connection_warmup: bool = True):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         
+        # Full URLs of already-seen endpoints, valid for _url_cache_base
+        self._url_cache: Dict[str, str] = {}
+        self._url_cache_base = self.base_url
+        
         # Connection pool configuration
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
         self.pool_block = pool_block
         self.enable_connection_warmup = enable_connection_warmup
         
-        # Create session with connection pooling
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Create session with connection pooling; headers and auth stay per client
         self.session = requests.Session()
         self._configure_connection_pool()
         
@@ -183,8 +248,6 @@ class BaseAPIClient:
         self.pool_stats = ConnectionPoolStats()
         self.pool_stats.pool_size = pool_maxsize
         
-        self.logger = logging.getLogger(self.__class__.__name__)
-        
         # Circuit breaker setup
         self.enable_circuit_breaker = enable_circuit_breaker
         if enable_circuit_breaker:
@@ -231,24 +294,37 @@ class BaseAPIClient:
         self._stats_lock = threading.Lock()
         
         # Default headers
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        self.session.headers.update(self._DEFAULT_HEADERS)
         
         # Warm up connections if enabled
         if self.enable_connection_warmup and self.base_url:
             self._warmup_connections()
     
+    @classmethod
+    def get_pooled(cls, base_url: str = "", **kwargs) -> 'BaseAPIClient':
+        """Get a client shared by every caller using the same base URL and settings.
+        
+        The client, including its headers and auth, is shared; use a regular
+        instance for requests that need their own credentials. Callers passing
+        different settings (timeout, circuit breaker, ...) get separate clients.
+        """
+        # Bind against __init__ so omitted and explicitly passed defaults share a client;
+        # values are keyed by repr since configs such as CircuitBreakerConfig are unhashable
+        bound = inspect.signature(cls.__init__).bind(None, base_url.rstrip('/'), **kwargs)
+        bound.apply_defaults()
+        settings = tuple((name, repr(value)) for name, value in list(bound.arguments.items())[1:])
+        key = (cls, settings)
+        with cls._pooled_clients_lock:
+            client = cls._pooled_clients.get(key)
+            if client is None:
+                client = cls(base_url, **kwargs)
+                cls._pooled_clients[key] = client
+            return client
+    
     def _configure_connection_pool(self):
         """Configure connection pool for the session."""
-        # Create custom adapter with connection pooling
-        adapter = ConnectionPoolAdapter(
-            pool_connections=self.pool_connections,
-            pool_maxsize=self.pool_maxsize,
-            pool_block=self.pool_block,
-            max_retries=3
-        )
+        # Share the pooled adapter with other clients using the same settings
+        adapter = _get_shared_adapter(self.pool_connections, self.pool_maxsize, self.pool_block)
         
         # Mount adapter for both HTTP and HTTPS
         self.session.mount('http://', adapter)
@@ -261,6 +337,12 @@ class BaseAPIClient:
         if not self.base_url:
             return
         
+        # Connections to this host are already pooled by an earlier client
+        with _shared_pool_lock:
+            if self.base_url in _warmed_up_urls:
+                return
+            _warmed_up_urls.add(self.base_url)
+        
         warmup_count = min(3, self.pool_connections)  # Warm up a few connections
         
         def warmup_request():
@@ -459,13 +541,30 @@ class BaseAPIClient:
     
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint"""
+        if self._url_cache_base != self.base_url:
+            # base_url was reassigned; earlier URLs no longer apply
+            self._url_cache = {}
+            self._url_cache_base = self.base_url
+        
+        url = self._url_cache.get(endpoint)
+        if url is not None:
+            return url
+        
         if endpoint.startswith(('http://', 'https://')):
-            return endpoint
-        return urljoin(self.base_url + '/', endpoint.lstrip('/'))
+            url = endpoint
+        else:
+            url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
+        # Bounded so tests that generate many distinct endpoints cannot grow it forever
+        if len(self._url_cache) < _URL_CACHE_SIZE:
+            self._url_cache[endpoint] = url
+        return url
     
     def _log_request(self, method: str, url: str, **kwargs):
         """Log request details"""
         self.logger.info(f"API Request: {method.upper()} {url}")
+        # Skip formatting payloads unless they will actually be logged
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if 'params' in kwargs:
             self.logger.debug(f"Query params: {kwargs['params']}")
         if 'json' in kwargs:
@@ -476,16 +575,34 @@ class BaseAPIClient:
     def _log_response(self, response: requests.Response):
         """Log response details"""
         self.logger.info(f"API Response: {response.status_code} {response.reason}")
+        # Parsing and formatting the body is only worth it when DEBUG is enabled
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(f"Response headers: {dict(response.headers)}")
         
         try:
-            if response.headers.get('content-type', '').startswith('application/json'):
-                self.logger.debug(f"Response body: {response.json()}")
+            content_type = response.headers.get('content-type')
+            if content_type is not None and content_type[:16] == 'application/json':
+                self.logger.debug(f"Response body: {_cached_json(response)}")
             else:
                 self.logger.debug(f"Response body: {response.text[:500]}...")
         except:
             pass
     
+    def _prepare_json_body(self, json_data: Optional[Dict], data: Optional[Union[Dict, str]],
+                           kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build request arguments, pre-encoding JSON bodies with orjson when it is installed"""
+        if orjson is not None and json_data is not None and data is None:
+            try:
+                body = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # Types orjson does not handle are left to requests' own encoder
+            else:
+                headers = {'Content-Type': 'application/json'}
+                headers.update(kwargs.get('headers') or {})
+                return {**kwargs, 'headers': headers, 'json': None, 'data': body}
+        return {**kwargs, 'json': json_data, 'data': data}
+    
     def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
         """Send GET request with enhanced error handling"""
         url = self._build_url(endpoint)
@@ -503,7 +620,8 @@ class BaseAPIClient:
         
         with error_context(f"POST {url}", additional_context={'endpoint': endpoint}):
             self._log_request('POST', url, json=json_data, data=data, **kwargs)
-            response = self._make_request_with_circuit_breaker('POST', url, json=json_data, data=data, **kwargs)
+            body_kwargs = self._prepare_json_body(json_data, data, kwargs)
+            response = self._make_request_with_circuit_breaker('POST', url, **body_kwargs)
             self._log_response(response)
             return response
     
@@ -514,7 +632,8 @@ class BaseAPIClient:
         
         with error_context(f"PUT {url}", additional_context={'endpoint': endpoint}):
             self._log_request('PUT', url, json=json_data, data=data, **kwargs)
-            response = self._make_request_with_circuit_breaker('PUT', url, json=json_data, data=data, **kwargs)
+            body_kwargs = self._prepare_json_body(json_data, data, kwargs)
+            response = self._make_request_with_circuit_breaker('PUT', url, **body_kwargs)
             self._log_response(response)
             return response
     
@@ -525,7 +644,8 @@ class BaseAPIClient:
         
         with error_context(f"PATCH {url}", additional_context={'endpoint': endpoint}):
             self._log_request('PATCH', url, json=json_data, data=data, **kwargs)
-            response = self._make_request_with_circuit_breaker('PATCH', url, json=json_data, data=data, **kwargs)
+            body_kwargs = self._prepare_json_body(json_data, data, kwargs)
+            response = self._make_request_with_circuit_breaker('PATCH', url, **body_kwargs)
             self._log_response(response)
             return response
     
@@ -566,13 +686,26 @@ class BaseAPIClient:
         
         with error_context(f"UPLOAD {url}", additional_context={'endpoint': endpoint, 'file_path': file_path}):
             with open(file_path, 'rb') as file:
-                files = {file_field: file}
                 self._log_request('POST', url, **kwargs)
                 
                 # Note: For file uploads, we bypass the normal JSON handling
                 kwargs_copy = kwargs.copy()
                 kwargs_copy.pop('json', None)  # Remove json if present
-                response = self._make_request_with_circuit_breaker('POST', url, files=files, **kwargs_copy)
+                headers = dict(kwargs_copy.pop('headers', None) or {})
+                
+                if MultipartEncoder is not None and 'data' not in kwargs_copy:
+                    # Read and sent in chunks, so memory stays flat for large files
+                    encoder = MultipartEncoder(fields={
+                        file_field: (os.path.basename(file_path), file, 'application/octet-stream')
+                    })
+                    headers['Content-Type'] = encoder.content_type
+                    kwargs_copy['data'] = encoder
+                else:
+                    # Drop the session's JSON Content-Type so requests sets the multipart one
+                    headers['Content-Type'] = None
+                    kwargs_copy['files'] = {file_field: file}
+                
+                response = self._make_request_with_circuit_breaker('POST', url, headers=headers, **kwargs_copy)
             
             self._log_response(response)
             return response
@@ -589,9 +722,10 @@ class BaseAPIClient:
             response = self._make_request_with_circuit_breaker('GET', url, **kwargs_copy)
             
             if response.status_code == 200:
+                # Copy the raw stream in 1 MiB blocks; decode_content still undoes gzip/deflate
+                response.raw.decode_content = True
                 with open(save_path, 'wb') as file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        file.write(chunk)
+                    shutil.copyfileobj(response.raw, file, length=_DOWNLOAD_CHUNK_SIZE)
                 
                 self.logger.info(f"File downloaded: {save_path}")
                 return True
@@ -646,5 +780,8 @@ class BaseAPIClient:
     
     def close(self):
         """Close the session"""
+        # Keep the shared connection pools open for other clients
+        for prefix in ('http://', 'https://'):
+            self.session.adapters.pop(prefix, None)
         self.session.close()
         self.logger.info("API client session closed")
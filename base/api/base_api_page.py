@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 import json
 import logging
-from .api_client import BaseAPIClient
+from .base_api_client import BaseAPIClient
 from ..utilities.recovery_strategies import (
     create_recovery_hook, auto_recovery_manager, 
     register_api_health_checker, recovery_context
@@ -1,10 +1,14 @@
 from playwright.sync_api import Page, Locator, expect
 import logging
 import time
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 import os
 from .playwright_manager import PlaywrightManager
 
+# Ceiling for explicit element/page-load waits, so missing elements fail fast.
+# Override with BEHAVE_PW_TIMEOUT (milliseconds) for slow environments.
+DEFAULT_WAIT_TIMEOUT = int(os.environ.get("BEHAVE_PW_TIMEOUT", "5000"))
+
 
 class BasePage:
     """Base page class for Playwright automation"""
@@ -18,6 +22,51 @@ class BasePage:
         self.default_timeout = 30000  # 30 seconds
         self.short_timeout = 5000     # 5 seconds
         self.long_timeout = 60000     # 60 seconds
+        self.wait_timeout = DEFAULT_WAIT_TIMEOUT
+        
+        # Locators are reusable, so each selector is built once per page object
+        self._locator_cache: Dict[str, Locator] = {}
+        
+        # The title only changes on navigation, so it is fetched once per
+        # navigation epoch and URL; bump_nav_epoch() invalidates it
+        self._nav_epoch = 0
+        self._title_cache: Tuple[Optional[Tuple[int, str]], str] = (None, "")
+    
+    def bump_nav_epoch(self) -> None:
+        """Mark that the page navigated, so cached page identity is refetched"""
+        self._nav_epoch += 1
+    
+    def _loc(self, selector: str) -> Locator:
+        """
+        Get a memoized locator for a selector
+        
+        Args:
+            selector (str): Element selector
+        
+        Returns:
+            Locator: Cached element locator
+        """
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self.page.locator(selector)
+            self._locator_cache[selector] = locator
+        return locator
+    
+    def navigate_to(self, url: str, wait_until: str = "networkidle") -> None:
+        """
+        Navigate to URL and drop cached locators
+        
+        Args:
+            url (str): URL to navigate to
+            wait_until (str): When to consider navigation successful
+        """
+        try:
+            self._locator_cache.clear()
+            self.bump_nav_epoch()
+            self.playwright_manager.navigate_to(url, wait_until=wait_until)
+        except Exception as e:
+            self.logger.error(f"Failed to navigate to {url}: {e}")
+            raise
     
     def find_element(self, selector: str, timeout: int = None) -> Locator:
         """
@@ -32,7 +81,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.wait_for(timeout=timeout)
             self.logger.info(f"Element found: {selector}")
             return element
@@ -51,7 +100,7 @@ class BasePage:
             List[Locator]: List of element locators
         """
         try:
-            elements = self.page.locator(selector).all()
+            elements = self._loc(selector).all()
             self.logger.info(f"Found {len(elements)} elements with selector: {selector}")
             return elements
         except Exception as e:
@@ -69,7 +118,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.click(timeout=timeout, force=force)
             self.logger.info(f"Clicked element: {selector}")
         except Exception as e:
@@ -86,7 +135,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.dblclick(timeout=timeout)
             self.logger.info(f"Double clicked element: {selector}")
         except Exception as e:
@@ -103,7 +152,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.click(button="right", timeout=timeout)
             self.logger.info(f"Right clicked element: {selector}")
         except Exception as e:
@@ -120,7 +169,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.hover(timeout=timeout)
             self.logger.info(f"Hovered over element: {selector}")
         except Exception as e:
@@ -139,7 +188,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             
             if clear:
                 element.clear(timeout=timeout)
@@ -161,7 +210,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.fill(text, timeout=timeout)
             self.logger.info(f"Filled text '{text}' into element: {selector}")
         except Exception as e:
@@ -178,7 +227,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.clear(timeout=timeout)
             self.logger.info(f"Cleared text from element: {selector}")
         except Exception as e:
@@ -198,7 +247,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             text = element.text_content(timeout=timeout)
             self.logger.info(f"Got text '{text}' from element: {selector}")
             return text or ""
@@ -219,7 +268,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             text = element.inner_text(timeout=timeout)
             self.logger.info(f"Got inner text '{text}' from element: {selector}")
             return text
@@ -241,7 +290,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             value = element.get_attribute(attribute, timeout=timeout)
             self.logger.info(f"Got attribute '{attribute}' = '{value}' from element: {selector}")
             return value or ""
@@ -262,7 +311,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.short_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             is_visible = element.is_visible(timeout=timeout)
             self.logger.info(f"Element visibility check for {selector}: {is_visible}")
             return is_visible
@@ -270,6 +319,63 @@ class BasePage:
             self.logger.error(f"Failed to check visibility of element {selector}: {e}")
             return False
     
+    def get_page_state(self, selectors: List[str]) -> Tuple[str, Dict[str, bool]]:
+        """
+        Get the page title and visibility of several elements in one browser round-trip
+        
+        Selectors using Playwright-only syntax are checked individually.
+        
+        Args:
+            selectors (List[str]): Element selectors to check
+        
+        Returns:
+            Tuple[str, Dict[str, bool]]: Page title and visibility keyed by selector
+        """
+        state = self.page.evaluate(
+            """sels => ({
+                title: document.title,
+                visible: sels.map(s => {
+                    let el;
+                    try {
+                        el = document.querySelector(s);
+                    } catch (e) {
+                        return null;  // Playwright-only syntax such as :has-text()
+                    }
+                    if (!el) return false;
+                    const style = getComputedStyle(el);
+                    return style.visibility !== 'hidden' && style.display !== 'none'
+                        && el.getClientRects().length > 0;
+                })
+            })""",
+            list(selectors)
+        )
+        
+        # Selectors the browser could not parse go through Playwright's engine
+        visibility = {
+            selector: result if result is not None else self._loc(selector).first.is_visible()
+            for selector, result in zip(selectors, state["visible"])
+        }
+        self._title_cache = ((self._nav_epoch, self.page.url), state["title"])
+        return state["title"], visibility
+    
+    def are_elements_visible(self, selectors: List[str]) -> Dict[str, bool]:
+        """
+        Check visibility of several elements in a single browser round-trip
+        
+        Args:
+            selectors (List[str]): Element selectors to check
+        
+        Returns:
+            Dict[str, bool]: Visibility keyed by selector
+        """
+        try:
+            _, visibility = self.get_page_state(selectors)
+            self.logger.info(f"Batch visibility check: {visibility}")
+            return visibility
+        except Exception as e:
+            self.logger.error(f"Failed to check visibility of elements {selectors}: {e}")
+            return {selector: False for selector in selectors}
+    
     def is_element_enabled(self, selector: str, timeout: int = None) -> bool:
         """
         Check if element is enabled
@@ -283,7 +389,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.short_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             is_enabled = element.is_enabled(timeout=timeout)
             self.logger.info(f"Element enabled check for {selector}: {is_enabled}")
             return is_enabled
@@ -304,7 +410,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.short_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             is_checked = element.is_checked(timeout=timeout)
             self.logger.info(f"Element checked state for {selector}: {is_checked}")
             return is_checked
@@ -322,8 +428,8 @@ class BasePage:
             timeout (int): Timeout in milliseconds
         """
         try:
-            timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            timeout = timeout or self.wait_timeout
+            element = self._loc(selector)
             element.wait_for(state=state, timeout=timeout)
             self.logger.info(f"Element {selector} reached state: {state}")
         except Exception as e:
@@ -340,7 +446,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.wait_for(state="hidden", timeout=timeout)
             self.logger.info(f"Element disappeared: {selector}")
         except Exception as e:
@@ -358,7 +464,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             
             if isinstance(option, int):
                 element.select_option(index=option, timeout=timeout)
@@ -382,7 +488,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.check(timeout=timeout)
             self.logger.info(f"Checked checkbox: {selector}")
         except Exception as e:
@@ -399,7 +505,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.uncheck(timeout=timeout)
             self.logger.info(f"Unchecked checkbox: {selector}")
         except Exception as e:
@@ -421,7 +527,7 @@ class BasePage:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.set_input_files(file_path, timeout=timeout)
             self.logger.info(f"Uploaded file '{file_path}' to element: {selector}")
         except Exception as e:
@@ -439,7 +545,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.press(key, timeout=timeout)
             self.logger.info(f"Pressed key '{key}' on element: {selector}")
         except Exception as e:
@@ -456,7 +562,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.scroll_into_view_if_needed(timeout=timeout)
             self.logger.info(f"Scrolled to element: {selector}")
         except Exception as e:
@@ -474,8 +580,8 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            source = self.page.locator(source_selector)
-            target = self.page.locator(target_selector)
+            source = self._loc(source_selector)
+            target = self._loc(target_selector)
             source.drag_to(target, timeout=timeout)
             self.logger.info(f"Dragged element {source_selector} to {target_selector}")
         except Exception as e:
@@ -490,7 +596,12 @@ class BasePage:
             str: Page title
         """
         try:
-            title = self.page.title()
+            # page.url is tracked client-side, so only the title needs a round-trip
+            key = (self._nav_epoch, self.page.url)
+            cached_key, title = self._title_cache
+            if cached_key != key:
+                title = self.page.title()
+                self._title_cache = (key, title)
             self.logger.info(f"Page title: {title}")
             return title
         except Exception as e:
@@ -588,7 +699,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             expect(element).to_be_visible(timeout=timeout)
             self.logger.info(f"Assertion passed: Element {selector} is visible")
         except Exception as e:
@@ -606,7 +717,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             expect(element).to_have_text(expected_text, timeout=timeout)
             self.logger.info(f"Assertion passed: Element {selector} has text '{expected_text}'")
         except Exception as e:
@@ -624,7 +735,7 @@ class BasePage:
         """
         try:
             timeout = timeout or self.default_timeout
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             expect(element).to_contain_text(expected_text, timeout=timeout)
             self.logger.info(f"Assertion passed: Element {selector} contains text '{expected_text}'")
         except Exception as e:
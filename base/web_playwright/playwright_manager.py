@@ -9,7 +9,7 @@ import os
 class PlaywrightManager:
     """Manager class for Playwright browser operations"""
     
-    def __init__(self):
+    def __init__(self, context_pool_size: int = 2):
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
@@ -20,6 +20,11 @@ class PlaywrightManager:
         self.default_timeout = 30000  # 30 seconds
         self.default_viewport = {"width": 1920, "height": 1080}
         
+        # Released contexts kept for reuse, keyed by their creation options
+        self.context_pool_size = context_pool_size
+        self._context_pool: Dict[tuple, List[BrowserContext]] = {}
+        self._context_key: Optional[tuple] = None
+        
     def start_playwright(self):
         """Start Playwright"""
         try:
@@ -90,12 +95,20 @@ class PlaywrightManager:
                 "ignore_https_errors": kwargs.get("ignore_https_errors", False),
                 "record_video_dir": kwargs.get("record_video_dir"),
                 "record_video_size": kwargs.get("record_video_size"),
-                "record_har_path": kwargs.get("record_har_path")
+                "record_har_path": kwargs.get("record_har_path"),
+                "storage_state": kwargs.get("storage_state")
             }
             
             # Remove None values
             context_options = {k: v for k, v in context_options.items() if v is not None}
             
+            self._context_key = self._get_context_pool_key(context_options)
+            pooled_contexts = self._context_pool.get(self._context_key)
+            if pooled_contexts:
+                self.context = pooled_contexts.pop()
+                self.logger.info("Reusing pooled browser context")
+                return self.context
+            
             self.context = self.browser.new_context(**context_options)
             self.context.set_default_timeout(self.default_timeout)
             
@@ -105,6 +118,96 @@ class PlaywrightManager:
             self.logger.error(f"Failed to create browser context: {e}")
             raise
     
+    def _get_context_pool_key(self, context_options: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the pool key for a set of context options
+        
+        Contexts seeded from a storage state or recording video/HAR cannot be
+        reset for reuse, so they are never pooled.
+        
+        Args:
+            context_options (Dict[str, Any]): Options passed to new_context
+        
+        Returns:
+            Optional[tuple]: Hashable key, or None if the context is not poolable
+        """
+        if any(option in context_options for option in ("storage_state", "record_video_dir", "record_har_path")):
+            return None
+        return tuple(sorted((name, repr(value)) for name, value in context_options.items()))
+    
+    def release_context(self) -> None:
+        """
+        Release the current context back to the pool instead of closing it
+        
+        Open pages are closed and cookies, permissions and web storage are
+        cleared so the next scenario starts clean. Contexts that are not
+        poolable, or that would exceed the pool size, are closed.
+        """
+        try:
+            if not self.context:
+                return
+            
+            pool = self._context_pool.setdefault(self._context_key, []) if self._context_key else None
+            if pool is None or len(pool) >= self.context_pool_size:
+                self.close_page()
+                self.close_context()
+                return
+            
+            for page in self.context.pages:
+                try:
+                    page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+                except Exception:
+                    pass  # about:blank and similar pages have no web storage
+                page.close()
+            
+            self.context.clear_cookies()
+            self.context.clear_permissions()
+            pool.append(self.context)
+            
+            self.context = None
+            self.page = None
+            self._context_key = None
+            self.logger.info("Browser context released to pool")
+        except Exception as e:
+            self.logger.error(f"Failed to release context: {e}")
+            self.page = None
+            self.close_context()
+    
+    def close_context_pool(self) -> None:
+        """Close all pooled browser contexts"""
+        for pooled_contexts in self._context_pool.values():
+            for pooled_context in pooled_contexts:
+                try:
+                    pooled_context.close()
+                except Exception as e:
+                    self.logger.error(f"Failed to close pooled context: {e}")
+        self._context_pool.clear()
+    
+    def save_storage_state(self, file_path: str) -> str:
+        """
+        Save cookies and local storage of the current context
+        
+        The saved file can be passed to create_context(storage_state=...) so
+        later contexts start already authenticated.
+        
+        Args:
+            file_path (str): Path to save the storage state JSON
+        
+        Returns:
+            str: Storage state file path
+        """
+        try:
+            if not self.context:
+                raise Exception("No browser context available")
+            
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self.context.storage_state(path=file_path)
+            self.logger.info(f"Storage state saved: {file_path}")
+            return file_path
+        except Exception as e:
+            self.logger.error(f"Failed to save storage state: {e}")
+            raise
+    
     def create_page(self) -> Page:
         """
         Create new page
@@ -157,8 +260,7 @@ class PlaywrightManager:
                 raise Exception("No page available for screenshot")
             
             if not file_path:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                file_path = f"screenshot_{timestamp}.png"
+                file_path = f"screenshot_{self.get_timestamp()}.png"
             
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
@@ -170,6 +272,15 @@ class PlaywrightManager:
             self.logger.error(f"Failed to take screenshot: {e}")
             raise
     
+    def get_timestamp(self) -> str:
+        """
+        Get a filesystem-safe timestamp for artifact names
+        
+        Returns:
+            str: Timestamp in YYYYmmdd_HHMMSS format
+        """
+        return time.strftime("%Y%m%d_%H%M%S")
+    
     def close_page(self) -> None:
         """Close current page"""
         try:
@@ -186,6 +297,7 @@ class PlaywrightManager:
             if self.context:
                 self.context.close()
                 self.context = None
+                self._context_key = None
                 self.logger.info("Browser context closed")
         except Exception as e:
             self.logger.error(f"Failed to close context: {e}")
@@ -215,6 +327,7 @@ class PlaywrightManager:
         try:
             self.close_page()
             self.close_context()
+            self.close_context_pool()
             self.close_browser()
             self.stop_playwright()
             self.logger.info("Playwright manager shutdown complete")
@@ -3,21 +3,182 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
+import os
+from contextlib import contextmanager
 from ..utilities.recovery_strategies import (
     create_recovery_hook, auto_recovery_manager, 
     register_webdriver_health_checker, recovery_context
 )
 from ..utilities.error_handler import WebDriverError, ErrorCategory
 
+# Polling interval for explicit waits; Selenium's own default of 500ms overshoots
+# UI that settles quickly. Override with BASE_POLL_MS (milliseconds).
+DEFAULT_POLL_FREQUENCY = float(os.environ.get("BASE_POLL_MS", "150")) / 1000
+
+
+def _xpath_literal(value):
+    """Quote a string for use as an XPath 1.0 literal"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _css_string(value):
+    """Quote a string for use inside a CSS attribute selector"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+# Locator strategies that have an exact CSS equivalent
+_CSS_EQUIVALENTS = {
+    By.CSS_SELECTOR: lambda value: value,
+    By.ID: lambda value: f"[id={_css_string(value)}]",
+    By.NAME: lambda value: f"[name={_css_string(value)}]",
+    By.CLASS_NAME: lambda value: f"[class~={_css_string(value)}]",
+    By.TAG_NAME: lambda value: value,
+}
+
+# Locator strategies that have an exact XPath equivalent
+_XPATH_EQUIVALENTS = {
+    By.XPATH: lambda value: value,
+    By.LINK_TEXT: lambda value: f"//a[normalize-space(.)={_xpath_literal(value)}]",
+    By.PARTIAL_LINK_TEXT: lambda value: f"//a[contains(., {_xpath_literal(value)})]",
+}
+
+# Sets a field's value through the native setter, so framework-bound inputs see
+# the change, and fires the events typing would. Returns false if nothing matched.
+_SET_VALUE_SCRIPT = """
+let el = arguments[0];
+if (typeof el === 'string') {
+    el = arguments[2] === 'xpath'
+        ? document.evaluate(el, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(el);
+}
+if (!el) return false;
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+if (setter && setter.set) {
+    setter.set.call(el, arguments[1]);
+} else {
+    el.value = arguments[1];
+}
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+
+# Returns null where checkVisibility() is unsupported so the caller can fall back
+_CHECK_VISIBILITY_SCRIPT = """
+const el = arguments[0];
+if (!el.checkVisibility) return null;
+return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true, contentVisibilityAuto: true});
+"""
+
+# Returns, for each [kind, query] pair, whether any matching element is visible
+_JS_QUERY_HELPERS = """
+const isVisible = el => {
+    if (el.checkVisibility) {
+        return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true});
+    }
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none'
+        && el.getClientRects().length > 0;
+};
+const queryAll = (kind, query) => {
+    if (kind === 'xpath') {
+        const result = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+    }
+    return Array.from(document.querySelectorAll(query));
+};
+"""
+_DISPLAYED_STATES_SCRIPT = _JS_QUERY_HELPERS + """
+return arguments[0].map(([kind, query]) => queryAll(kind, query).some(isVisible));
+"""
+
+# Returns the number of matches for each [kind, query] pair
+_MATCH_COUNTS_SCRIPT = _JS_QUERY_HELPERS + """
+return arguments[0].map(([kind, query]) => queryAll(kind, query).length);
+"""
+
+# Returns the rendered text of the first visible match, trying queries in order, or null
+_FIRST_DISPLAYED_TEXT_SCRIPT = _JS_QUERY_HELPERS + """
+for (const [kind, query] of arguments[0]) {
+    const el = queryAll(kind, query).find(isVisible);
+    if (el) return el.innerText;
+}
+return null;
+"""
+
+# Sets each [kind, query, value] field, picking <select> options by value or label;
+# returns whether each field was found and set
+_FILL_FORM_SCRIPT = _JS_QUERY_HELPERS + """
+return arguments[0].map(([kind, query, value]) => {
+    const el = queryAll(kind, query)[0];
+    if (!el) return false;
+    if (el.tagName === 'SELECT') {
+        const option = Array.from(el.options).find(
+            o => o.value === value || o.text.trim() === value
+        );
+        if (!option) return false;
+        el.value = option.value;
+    } else {
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+        if (setter && setter.set) {
+            setter.set.call(el, value);
+        } else {
+            el.value = value;
+        }
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+    }
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+});
+"""
+
+
+def _locator_to_query(locator):
+    """Translate a locator into a ('css'|'xpath', query) pair, or None if it has no equivalent"""
+    by, value = locator
+    if by in _CSS_EQUIVALENTS:
+        return ("css", _CSS_EQUIVALENTS[by](value))
+    if by in _XPATH_EQUIVALENTS:
+        return ("xpath", _XPATH_EQUIVALENTS[by](value))
+    return None
+
+
+# In-browser queries keyed by locator tuple, filled for page-object locators at class creation
+_LOCATOR_QUERIES = {}
+
 
 class BasePage:
     """Base page class that all page objects should inherit from"""
     
+    def __init_subclass__(cls, **kwargs):
+        """Translate the page object's class-level locators into in-browser queries once"""
+        super().__init_subclass__(**kwargs)
+        for name, value in vars(cls).items():
+            if name.isupper() and isinstance(value, tuple) and len(value) == 2 \
+                    and all(isinstance(part, str) for part in value):
+                _LOCATOR_QUERIES.setdefault(value, _locator_to_query(value))
+    
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.poll_frequency = DEFAULT_POLL_FREQUENCY
+        self.wait = WebDriverWait(driver, 10, poll_frequency=self.poll_frequency)
+        
+        # The session's implicit wait, restored after blocks that need it off
+        try:
+            self._session_implicit_wait = driver.timeouts.implicit_wait
+        except Exception:
+            self._session_implicit_wait = 0
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Fingerprints of pages that passed an identity check, see _page_fingerprint()
+        self._verify_cache = set()
+        # URL read along with the last fingerprint, saving a separate current_url call
+        self._cached_url = None
+        
         # Initialize recovery mechanisms
         self.component_name = f"webdriver_{self.__class__.__name__.lower()}"
         self.recovery_hook = create_recovery_hook(self.component_name)
@@ -73,6 +234,32 @@ class BasePage:
             self.logger.error(f"Error during WebDriver recovery: {recovery_error}")
             return False
     
+    @contextmanager
+    def _implicit_wait(self, timeout):
+        """Temporarily set the driver's implicit wait so element lookups poll in the browser"""
+        self.driver.implicitly_wait(timeout)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self._session_implicit_wait)
+    
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Turn the session's implicit wait off for a block.
+        
+        Explicit waits and non-waiting probes would otherwise stall for the
+        implicit wait on every lookup of a missing element.
+        """
+        if not self._session_implicit_wait:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self._session_implicit_wait)
+    
     def _execute_with_recovery(self, operation_name: str, operation_func, *args, **kwargs):
         """Execute WebDriver operations with recovery capabilities."""
         with recovery_context(self.component_name, auto_recovery_manager, max_recovery_attempts=1):
@@ -82,9 +269,10 @@ class BasePage:
         """Find a single element"""
         def _find():
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located(locator)
-                )
+                with self._no_implicit_wait():
+                    element = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
+                        EC.presence_of_element_located(locator)
+                    )
                 return element
             except TimeoutException:
                 self.logger.error(f"Element not found: {locator}")
@@ -108,6 +296,37 @@ class BasePage:
         element.send_keys(text)
         self.logger.info(f"Typed '{text}' into element: {locator}")
     
+    def js_set_value(self, locator, text, timeout=10):
+        """Set a field's value in one browser call instead of clearing and typing key by key"""
+        query = self._to_query(locator)
+        if query and self.driver.execute_script(_SET_VALUE_SCRIPT, query[1], text, query[0]):
+            return
+        # Not rendered yet, or no in-browser equivalent: wait for the element first
+        element = self.find_element(locator, timeout)
+        self.driver.execute_script(_SET_VALUE_SCRIPT, element, text)
+    
+    def fill_form(self, field_values):
+        """Set a locator -> value map of form fields in a single WebDriver call, returning which were filled"""
+        locators = list(field_values)
+        queries = [self._to_query(locator) for locator in locators]
+        filled = {}
+        if None not in queries:
+            results = self.driver.execute_script(
+                _FILL_FORM_SCRIPT,
+                [[kind, query, field_values[locator]] for (kind, query), locator in zip(queries, locators)]
+            )
+            filled = dict(zip(locators, results))
+        else:
+            # No single in-browser query covers these, so set the fields one by one
+            for locator in locators:
+                with self._no_implicit_wait():
+                    elements = self.driver.find_elements(*locator)
+                if elements:
+                    self.driver.execute_script(_SET_VALUE_SCRIPT, elements[0], field_values[locator])
+                filled[locator] = bool(elements)
+        self.logger.info(f"Filled {sum(filled.values())} of {len(locators)} form fields")
+        return filled
+    
     def get_text(self, locator, timeout=10):
         """Get text from an element"""
         element = self.find_element(locator, timeout)
@@ -122,12 +341,25 @@ class BasePage:
         self.logger.info(f"Got attribute '{attribute}' = '{value}' from element: {locator}")
         return value
     
+    def get_value(self, locator, timeout=10):
+        """Get the value of a form field, in one browser call when the locator has a CSS equivalent"""
+        query = self._to_query(locator)
+        if query and query[0] == "css":
+            value = self.driver.execute_script(
+                "const el = document.querySelector(arguments[0]); return el ? el.value : null;",
+                query[1]
+            )
+            if value is not None:
+                return value
+        return self.get_attribute(locator, 'value', timeout) or ""
+    
     def wait_for_element_visible(self, locator, timeout=10):
         """Wait for element to be visible"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            with self._no_implicit_wait():
+                element = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
+                    EC.visibility_of_element_located(locator)
+                )
             return element
         except TimeoutException:
             self.logger.error(f"Element not visible: {locator}")
@@ -136,9 +368,10 @@ class BasePage:
     def wait_for_element_clickable(self, locator, timeout=10):
         """Wait for element to be clickable"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
+            with self._no_implicit_wait():
+                element = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
+                    EC.element_to_be_clickable(locator)
+                )
             return element
         except TimeoutException:
             self.logger.error(f"Element not clickable: {locator}")
@@ -147,9 +380,10 @@ class BasePage:
     def wait_for_element_invisible(self, locator, timeout=10):
         """Wait for element to become invisible"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
-            )
+            with self._no_implicit_wait():
+                WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
+                    EC.invisibility_of_element_located(locator)
+                )
             return True
         except TimeoutException:
             self.logger.error(f"Element still visible: {locator}")
@@ -163,6 +397,11 @@ class BasePage:
         except TimeoutException:
             return False
     
+    def element_exists(self, locator):
+        """Check if element is in the DOM right now, without raising on a miss"""
+        with self._no_implicit_wait():
+            return bool(self.driver.find_elements(*locator))
+    
     def is_element_visible(self, locator, timeout=5):
         """Check if element is visible"""
         try:
@@ -171,6 +410,86 @@ class BasePage:
         except TimeoutException:
             return False
     
+    def _is_visible_fast(self, element):
+        """Check element visibility with the browser's checkVisibility(), falling back to is_displayed()"""
+        visible = self.driver.execute_script(_CHECK_VISIBILITY_SCRIPT, element)
+        if visible is None:
+            return element.is_displayed()
+        return visible
+    
+    def is_element_displayed(self, locator):
+        """Check if element is currently displayed, without waiting for it"""
+        try:
+            # The in-browser query is not subject to the implicit wait
+            if self._to_query(locator):
+                return self._displayed_states(locator)[0]
+            with self._no_implicit_wait():
+                elements = self.driver.find_elements(*locator)
+            return any(self._is_visible_fast(element) for element in elements)
+        except Exception:
+            return False
+    
+    def _to_query(self, locator):
+        """Translate a locator into a ('css'|'xpath', query) pair, or None if it has no equivalent"""
+        try:
+            return _LOCATOR_QUERIES[locator]
+        except KeyError:
+            query = _LOCATOR_QUERIES[locator] = _locator_to_query(locator)
+            return query
+    
+    def _displayed_states(self, *locators):
+        """Check visibility of several locators in a single WebDriver call"""
+        queries = [self._to_query(locator) for locator in locators]
+        if None in queries:
+            # No single in-browser query covers these, so check them one by one
+            states = []
+            with self._no_implicit_wait():
+                for locator in locators:
+                    elements = self.driver.find_elements(*locator)
+                    states.append(any(self._is_visible_fast(element) for element in elements))
+            return states
+        return self.driver.execute_script(_DISPLAYED_STATES_SCRIPT, [list(query) for query in queries])
+    
+    def _first_displayed_text(self, *locators):
+        """Get the text of the first displayed element matching any locator, or "" if none is"""
+        queries = [self._to_query(locator) for locator in locators]
+        if None not in queries:
+            # One in-browser call, not subject to the implicit wait
+            text = self.driver.execute_script(_FIRST_DISPLAYED_TEXT_SCRIPT, [list(query) for query in queries])
+            return text or ""
+        with self._no_implicit_wait():
+            elements = [element for locator in locators for element in self.driver.find_elements(*locator)]
+        for element in elements:
+            if self._is_visible_fast(element):
+                return element.text
+        return ""
+    
+    def _page_fingerprint(self):
+        """Get a cheap fingerprint of the page state that changes on navigation or re-render"""
+        title, url, child_count = self.driver.execute_script(
+            "return [document.title, location.href, "
+            "document.body ? document.body.childElementCount : 0];"
+        )
+        self._cached_url = url
+        return f"{title}|{url}|{child_count}"
+    
+    def query_dom_state(self, locator_map):
+        """Count the matches of a name -> locator map in a single WebDriver call"""
+        names = list(locator_map)
+        queries = [self._to_query(locator_map[name]) for name in names]
+        if None in queries:
+            with self._no_implicit_wait():
+                counts = [len(self.driver.find_elements(*locator_map[name])) for name in names]
+        else:
+            counts = self.driver.execute_script(_MATCH_COUNTS_SCRIPT, [list(query) for query in queries])
+        return dict(zip(names, counts))
+    
+    def _bulk_visible(self, locator_map):
+        """Check visibility of a name -> locator map in a single WebDriver call"""
+        names = list(locator_map)
+        states = self._displayed_states(*(locator_map[name] for name in names))
+        return dict(zip(names, states))
+    
     def scroll_to_element(self, locator, timeout=10):
         """Scroll to an element"""
         element = self.find_element(locator, timeout)
@@ -228,7 +547,7 @@ class BasePage:
     
     def wait_for_page_load(self, timeout=30):
         """Wait for page to fully load"""
-        WebDriverWait(self.driver, timeout).until(
+        WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
             lambda driver: driver.execute_script("return document.readyState") == "complete"
         )
         self.logger.info("Page fully loaded")
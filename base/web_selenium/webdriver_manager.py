@@ -184,10 +184,14 @@ class WebDriverManager:
                 'headless': 'false',
                 'window_size': '1920x1080',
                 'timeout': '10',
+                'implicit_wait': '2',
                 'cleanup_interval': '300',
                 'memory_threshold_mb': '500'
             }
         
+        # Selenium Grid hub to run browsers on instead of locally, e.g. one per behavex worker
+        self.grid_url = os.environ.get('GRID_URL') or self.config.get('selenium', 'grid_url', fallback='')
+        
         # Setup automatic cleanup
         self._setup_automatic_cleanup()
     
@@ -239,9 +243,10 @@ class WebDriverManager:
         else:
             raise ValueError(f"Unsupported browser: {browser}")
         
-        # Set implicit wait
-        timeout = self.config.getint('selenium', 'timeout', fallback=10)
-        self.driver.implicitly_wait(timeout)
+        # Short implicit wait so single-element lookups poll inside the driver;
+        # explicit waits in BasePage switch it off while they run
+        implicit_wait = self.config.getfloat('selenium', 'implicit_wait', fallback=2)
+        self.driver.implicitly_wait(implicit_wait)
         
         # Register driver with tracking
         self.driver_id = f"{browser}_{threading.current_thread().ident}_{int(time.time())}"
@@ -250,28 +255,6 @@ class WebDriverManager:
         self.logger.info(f"WebDriver initialized: {browser} (ID: {self.driver_id})")
         return self.driver
     
-    def get_driver(self, browser=None, headless=None, window_size=None):
-        """Get WebDriver instance with specified configuration"""
-        browser = browser or self.config.get('selenium', 'browser', fallback='chrome')
-        headless = headless or self.config.getboolean('selenium', 'headless', fallback=False)
-        window_size = window_size or self.config.get('selenium', 'window_size', fallback='1920x1080')
-        
-        if browser.lower() == 'chrome':
-            self.driver = self._get_chrome_driver(headless, window_size)
-        elif browser.lower() == 'firefox':
-            self.driver = self._get_firefox_driver(headless, window_size)
-        elif browser.lower() == 'edge':
-            self.driver = self._get_edge_driver(headless, window_size)
-        else:
-            raise ValueError(f"Unsupported browser: {browser}")
-        
-        # Set implicit wait
-        timeout = self.config.getint('selenium', 'timeout', fallback=10)
-        self.driver.implicitly_wait(timeout)
-        
-        self.logger.info(f"WebDriver initialized: {browser}")
-        return self.driver
-    
     def _get_chrome_driver(self, headless, window_size):
         """Initialize Chrome WebDriver"""
         from selenium.webdriver.chrome.options import Options
@@ -288,6 +271,9 @@ class WebDriverManager:
         options.add_argument('--disable-web-security')
         options.add_argument('--allow-running-insecure-content')
         
+        if self.grid_url:
+            return webdriver.Remote(command_executor=self.grid_url, options=options)
+        
         service = ChromeService(ChromeDriverManager().install())
         return webdriver.Chrome(service=service, options=options)
     
@@ -304,6 +290,9 @@ class WebDriverManager:
         options.add_argument(f'--width={width}')
         options.add_argument(f'--height={height}')
         
+        if self.grid_url:
+            return webdriver.Remote(command_executor=self.grid_url, options=options)
+        
         service = FirefoxService(GeckoDriverManager().install())
         return webdriver.Firefox(service=service, options=options)
     
@@ -320,30 +309,36 @@ class WebDriverManager:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         
+        if self.grid_url:
+            return webdriver.Remote(command_executor=self.grid_url, options=options)
+        
         service = EdgeService(EdgeChromiumDriverManager().install())
         return webdriver.Edge(service=service, options=options)
     
     def quit_driver(self):
         """Enhanced quit with proper cleanup and verification"""
-        if self.driver and self.driver_id:
+        if self.driver:
             try:
                 # Update usage before cleanup
-                self.registry.update_driver_usage(self.driver_id)
-                
-                # Get driver info for verification
-                driver_info = self.registry.get_driver_info(self.driver_id)
-                if driver_info:
-                    process_id = driver_info.process_id
-                    
-                    # Quit the driver
-                    self.driver.quit()
+                process_id = None
+                if self.driver_id:
+                    self.registry.update_driver_usage(self.driver_id)
                     
-                    # Verify process termination
-                    if process_id:
-                        self._verify_process_termination(process_id)
+                    # Get driver info for verification
+                    driver_info = self.registry.get_driver_info(self.driver_id)
+                    if driver_info:
+                        process_id = driver_info.process_id
+                
+                # Quit the driver, tracked or not
+                self.driver.quit()
+                
+                # Verify process termination
+                if process_id:
+                    self._verify_process_termination(process_id)
                 
                 # Unregister from tracking
-                self.registry.unregister_driver(self.driver_id)
+                if self.driver_id:
+                    self.registry.unregister_driver(self.driver_id)
                 
                 self.logger.info(f"WebDriver quit and verified (ID: {self.driver_id})")
                 
@@ -472,6 +467,18 @@ class WebDriverManager:
             self.logger.info("All cookies deleted")
             self._update_driver_usage()
     
+    def reset_session(self):
+        """Reset browser state so the driver can be reused by the next test"""
+        if self.driver:
+            try:
+                self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # Pages such as data: URLs have no web storage
+            self.driver.delete_all_cookies()
+            self.driver.get("about:blank")
+            self.logger.info("Browser session reset")
+            self._update_driver_usage()
+    
     def add_cookie(self, cookie_dict):
         """Add a cookie"""
         if self.driver:
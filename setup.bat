@@ -73,6 +73,14 @@ if errorlevel 1 (
     exit /b 1
 )
 
+REM Install the framework's base package so suites can import it directly
+pip install -e .
+if errorlevel 1 (
+    echo ERROR: Failed to install the framework base package
+    pause
+    exit /b 1
+)
+
 REM Install Playwright browsers (optional)
 echo.
 echo [6/8] Installing Playwright browsers...
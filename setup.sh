@@ -81,6 +81,13 @@ if [ $? -ne 0 ]; then
     exit 1
 fi
 
+# Install the framework's base package so suites can import it directly
+pip install -e .
+if [ $? -ne 0 ]; then
+    echo "ERROR: Failed to install the framework base package"
+    exit 1
+fi
+
 # Install Playwright browsers (optional)
 echo
 echo "[6/8] Installing Playwright browsers..."
@@ -0,0 +1,54 @@
+"""Tests for the JSON comparison helpers in base.api.api_test_helpers"""
+
+import pytest
+
+pytest.importorskip("requests")
+
+from base.api.api_test_helpers import APITestHelpers, _find_json_diffs
+
+
+@pytest.mark.parametrize("obj1, obj2, path", [
+    (1, True, ""),
+    ({"a": 1}, {"a": True}, "a"),
+    ({"a": {"b": 1}}, {"a": {"b": 1.0}}, "a.b"),
+    ([1], [1.0], "[0]"),
+    ([{"flag": False}], [{"flag": 0}], "[0].flag"),
+])
+def test_find_json_diffs_reports_nested_type_mismatches(obj1, obj2, path):
+    differences = _find_json_diffs(obj1, obj2)
+    
+    assert len(differences) == 1
+    assert differences[0].startswith(f"{path}: type mismatch")
+
+
+def test_find_json_diffs_equal_payloads():
+    payload = {"users": [{"id": 1, "active": True, "score": 1.5}], "total": 1}
+    
+    assert _find_json_diffs(payload, {"users": [{"id": 1, "active": True, "score": 1.5}], "total": 1}) == []
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response carrying a JSON body"""
+    
+    def __init__(self, body: bytes):
+        self.content = body
+
+
+@pytest.mark.parametrize("body1, body2", [
+    (b'{"a": 1}', b'{"a": true}'),
+    (b'[1]', b'[1.0]'),
+    (b'{"a": {"b": 0}}', b'{"a": {"b": false}}'),
+])
+def test_compare_json_responses_reports_nested_type_mismatches(body1, body2):
+    result = APITestHelpers.compare_json_responses(FakeResponse(body1), FakeResponse(body2))
+    
+    assert result['equal'] is False
+    assert result['differences']
+
+
+def test_compare_json_responses_ignores_key_order():
+    result = APITestHelpers.compare_json_responses(
+        FakeResponse(b'{"a": 1, "b": [true]}'), FakeResponse(b'{"b": [true], "a": 1}')
+    )
+    
+    assert result == {'equal': True, 'differences': []}
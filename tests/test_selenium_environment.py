@@ -0,0 +1,61 @@
+"""Tests for the Selenium suite's behave hooks and the driver lifecycle they rely on"""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("psutil")
+pytest.importorskip("webdriver_manager")
+
+from base.web_selenium.webdriver_manager import WebDriverManager
+
+ENVIRONMENT_PATH = Path(__file__).resolve().parents[1] / "SystemName (Example)" / "Web (Selenium)" / "features" / "environment.py"
+
+
+def _load_environment():
+    spec = importlib.util.spec_from_file_location("selenium_environment", ENVIRONMENT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeDriver:
+    """Stands in for a WebDriver, recording the calls the hooks make"""
+    
+    def __init__(self):
+        self.quit_calls = 0
+    
+    def implicitly_wait(self, timeout):
+        pass
+    
+    def quit(self):
+        self.quit_calls += 1
+
+
+def test_after_all_quits_shared_driver(monkeypatch):
+    driver = FakeDriver()
+    manager = WebDriverManager()
+    monkeypatch.setattr(manager, "_get_chrome_driver", lambda headless, window_size: driver)
+    manager.get_driver("chrome")
+    assert manager.driver_id is not None
+    
+    context = SimpleNamespace(driver_manager=manager, test_results=[], failed_scenarios=[])
+    _load_environment().after_all(context)
+    
+    assert driver.quit_calls >= 1
+    assert manager.driver is None
+    assert manager.driver_id is None
+
+
+def test_quit_driver_quits_untracked_driver():
+    driver = FakeDriver()
+    manager = WebDriverManager()
+    manager.driver = driver
+    
+    manager.quit_driver()
+    
+    assert driver.quit_calls == 1
+    assert manager.driver is None